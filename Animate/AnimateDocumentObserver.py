@@ -32,54 +32,68 @@ AnimateDocumentObserver and a method how to safely add it to FreeCAD.
 """
 
 import FreeCAD
+import weakref
 
-from PySide2.QtWidgets import QMessageBox
+from CollisionObject import CollisionProxy
 
 ## All the DocumentObjectGroupPython classes in the Animate workbench
-ANIMATE_OBJECT_GROUP_CLASSES = ["TrajectoryProxy", "ControlProxy",
-                                "CollisionDetectorProxy", "RobWorldProxy",
-                                "RobRotationProxy", "RobTranslationProxy"]
+ANIMATE_OBJECT_GROUP_CLASSES = frozenset({
+    "TrajectoryProxy", "ControlProxy", "CollisionDetectorProxy",
+    "RobWorldProxy", "RobRotationProxy", "RobTranslationProxy"})
 
 ## All the FeaturePython and DocumentObjectGroupPython  classes in the animate
 # toolbox
-ANIMATE_CLASSES = ["TrajectoryProxy", "ControlProxy", "ServerProxy",
-                   "CollisionDetectorProxy", "CollisionProxy", "RobWorldProxy",
-                   "RobRotationProxy", "RobTranslationProxy"]
+ANIMATE_CLASSES = frozenset({
+    "TrajectoryProxy", "ControlProxy", "ServerProxy", "CollisionDetectorProxy",
+    "CollisionProxy", "RobWorldProxy", "RobRotationProxy",
+    "RobTranslationProxy"})
 
 ## Classes allowed in the Control group
-ALLOWED_IN_CONTROL = ["TrajectoryProxy", "ServerProxy",
-                      "CollisionDetectorProxy", "RobWorldProxy",
-                      "RobRotationProxy", "RobTranslationProxy"]
+ALLOWED_IN_CONTROL = frozenset({
+    "TrajectoryProxy", "ServerProxy", "CollisionDetectorProxy",
+    "RobWorldProxy", "RobRotationProxy", "RobTranslationProxy"})
+
+## Robot group classes which can contain robot joints
+ROB_GROUPS = frozenset({"RobWorldProxy", "RobRotationProxy",
+                        "RobTranslationProxy"})
+
+## Robot joint classes allowed in robot groups
+ROB_MEMBERS = frozenset({"RobRotationProxy", "RobTranslationProxy"})
+
+## Pairs of group and object classes which can be grouped together
+ALLOWED_PAIRS = frozenset(
+    [("TrajectoryProxy", "TrajectoryProxy")]
+    + [("ControlProxy", obj_type) for obj_type in ALLOWED_IN_CONTROL]
+    + [(group_type, obj_type) for group_type in ROB_GROUPS
+       for obj_type in ROB_MEMBERS])
+
+## Sentinel returned by `getattr` for attributes an object doesn't have.
+MISSING = object()
 
 
 class AnimateDocumentObserver(object):
     """
 Class that keeps `Animate` workbench objects in recommended structures.
 
-
+Use `addObserver` to get the single instance registered in FreeCAD.
 
 Attributes:
-    __instance: A reference to a singleton.
-    server_proxies: A dict of document names and `ServerProxies` in them.
+    server_proxies: A dict of document names and weak references to
+        `ServerProxies` in them.
     group_before: A list of objects inside a group object about to change.
+    proxy_types: A dict of object ids and their proxy class names.
 
     """
 
-    __instance = None
-    server_proxies = {}
+    __slots__ = ("server_proxies", "group_before", "proxy_types")
 
-    def __new__(cls, *args, **kwargs):
+    def __init__(self):
         """
-Method creating an `AnimateDocumentObserver` singleton instance.
-
-Returns:
-    An `AnimateDocumentObserver` singleton instance.
+Initialization method for AnimateDocumentObserver.
         """
-        # Make AnimateDocumentObserver a singleton
-        if cls.__instance is None:
-            cls.__instance = super(AnimateDocumentObserver,
-                                   cls).__new__(cls, *args, **kwargs)
-        return cls.__instance
+        self.server_proxies = {}
+        self.group_before = []
+        self.proxy_types = {}
 
     def slotBeforeChangeObject(self, obj, prop):
         """
@@ -96,6 +110,7 @@ Args:
         if prop == "Group":
             FreeCAD.ActiveDocument.openTransaction()
             self.group_before = obj.Group
+            self.proxy_types.clear()
 
     def slotChangedObject(self, obj, prop):
         """
@@ -111,50 +126,96 @@ Args:
     obj: An object in the observed document about to change.
     prop: A str of a property about to change.
         """
+        # Only changes of group contents are checked
+        if prop != "Group":
+            return
+
+        doc = FreeCAD.ActiveDocument
+        group = obj.Group
+        group_before = self.group_before
         # If objects are added to a group
-        if prop == "Group" and len(obj.Group) > len(self.group_before):
+        if len(group) > len(group_before):
             # If a new object is added to a group object from Animate workbench
-            new_obj = obj.Group[-1]
+            new_obj = group[-1]
             if self.isAnimateGroup(obj):
                 # An object not from Animate workbench was added to it
                 if self.foreignObjectInAnimateGroup(new_obj, obj):
+                    from PySide2.QtWidgets import QMessageBox
                     QMessageBox.warning(
                             None, 'Forbidden action detected',
                             "Group objects from Animate workbench can group\n"
                             + "only selected objects from Animate workbench.\n"
                             + "Check the user guide for more info.")
-                    FreeCAD.ActiveDocument.undo()
+                    doc.undo()
                 else:
-                    FreeCAD.ActiveDocument.commitTransaction()
+                    doc.commitTransaction()
 
             # An object is added to a group not from Animate workbench
             else:
                 # The added object was from Animate workbench
                 if self.animateObjectInForeignGroup(new_obj, obj):
+                    from PySide2.QtWidgets import QMessageBox
                     QMessageBox.warning(
                             None, 'Forbidden action detected',
                             "Objects from Animate workbench can be grouped\n"
                             + "only by selected objects from Animate "
                             + "workbench.\nCheck the user guide "
                             + "for more info.")
-                    FreeCAD.ActiveDocument.undo()
+                    doc.undo()
                 else:
-                    FreeCAD.ActiveDocument.commitTransaction()
+                    doc.commitTransaction()
 
         # If objects are removed from a group
-        elif prop == "Group" and len(obj.Group) < len(self.group_before):
+        elif len(group) < len(group_before):
             # If a Collision is removed from
-            removed = set(self.group_before).difference(set(obj.Group)).pop()
-            if removed.Proxy.__class__.__name__ == "CollisionProxy" and \
-                    hasattr(obj, "Proxy") and not obj.Proxy.resetting and \
-                    not obj.Proxy.checking:
+            remaining = group if len(group) < 8 else set(group)
+            removed = next(o for o in group_before if o not in remaining)
+            proxy = getattr(obj, "Proxy", None)
+            if type(removed.Proxy) is CollisionProxy and \
+                    proxy is not None and not proxy.resetting and \
+                    not proxy.checking:
+                from PySide2.QtWidgets import QMessageBox
                 QMessageBox.warning(
                         None, 'Forbidden action detected',
                         "Collision objects cannot be removed from\n"
                         + "a CollisionDetector group.")
-                FreeCAD.ActiveDocument.undo()
+                doc.undo()
             else:
-                FreeCAD.ActiveDocument.commitTransaction()
+                doc.commitTransaction()
+
+        # If the group was only reordered, keep it, otherwise close the
+        # transaction without recording an empty undo step
+        elif group != group_before:
+            doc.commitTransaction()
+        else:
+            doc.abortTransaction()
+
+    def proxyType(self, obj):
+        """
+Method returning a name of an object's `Proxy` class.
+
+If the `Proxy` is NoneType (e.g. the object is not restored yet), the name
+is extrapolated from the object name. Names are remembered until another group
+object is about to change, so that checks of one change share them.
+
+Args:
+    obj: An object in the observed document.
+
+Returns:
+    A str name of the `Proxy` class or an empty str if there is no `Proxy`.
+        """
+        obj_type = self.proxy_types.get(id(obj))
+        if obj_type is None:
+            proxy = getattr(obj, "Proxy", MISSING)
+            # If a proxy is NoneType extrapolate it from object name
+            if proxy is MISSING:
+                obj_type = ""
+            elif proxy is None:
+                obj_type = obj.Name.rstrip('0123456789') + "Proxy"
+            else:
+                obj_type = proxy.__class__.__name__
+            self.proxy_types[id(obj)] = obj_type
+        return obj_type
 
     def isAnimateGroup(self, obj):
         """
@@ -167,14 +228,7 @@ an `Animate` group.
 Returns:
     True if the group object is from `Animate` workbench and false otherwise.
         """
-        # If a proxy is NoneType extrapolate it from object name
-        if not hasattr(obj, "Proxy"):
-            return False
-        else:
-            if obj.Proxy.__class__.__name__ == "NoneType":
-                obj_type = obj.Name.rstrip('0123456789') + "Proxy"
-            else:
-                obj_type = obj.Proxy.__class__.__name__
+        obj_type = self.proxyType(obj)
 
         # Check if proxy is an Animate group class
         if obj_type not in ANIMATE_OBJECT_GROUP_CLASSES:
@@ -193,14 +247,7 @@ from the `Animate` workbench.
 Returns:
     True if the object is from `Animate` workbench and false otherwise.
         """
-        # If a proxy is NoneType extrapolate it from object name
-        if not hasattr(obj, "Proxy"):
-            return False
-        else:
-            if obj.Proxy.__class__.__name__ == "NoneType":
-                obj_type = obj.Name.rstrip('0123456789') + "Proxy"
-            else:
-                obj_type = obj.Proxy.__class__.__name__
+        obj_type = self.proxyType(obj)
 
         # Check if proxy is an Animate object class
         if obj_type not in ANIMATE_CLASSES:
@@ -223,37 +270,19 @@ Args:
 Returns:
     True if a forbidden object is in a Animate group obj. and false otherwise.
         """
-        # If an obj proxy is NoneType extrapolate it from object name
-        if not hasattr(obj, "Proxy"):
+        obj_type = self.proxyType(obj)
+        if not obj_type:
             return False
-        else:
-            if obj.Proxy.__class__.__name__ == "NoneType":
-                obj_type = obj.Name.rstrip('0123456789') + "Proxy"
-            else:
-                obj_type = obj.Proxy.__class__.__name__
-
-        # If an obj proxy is NoneType extrapolate it from object name
-        if group.Proxy.__class__.__name__ == "NoneType":
-            group_type = group.Name.rstrip('0123456789') + "Proxy"
-        else:
-            group_type = group.Proxy.__class__.__name__
+        group_type = self.proxyType(group)
 
-        # Only a Trajectory can be in a Trajectory group
-        if group_type == "TrajectoryProxy" and obj_type == "TrajectoryProxy":
-            return False
-
-        # Only some objects can be in a Control group
-        elif group_type == "ControlProxy" and obj_type in ALLOWED_IN_CONTROL:
+        # Trajectories can be stacked, Control groups some objects and
+        # RobWorld, RobRotation and RobTranslation only robot joints
+        if (group_type, obj_type) in ALLOWED_PAIRS:
             return False
 
+        # Only Collision objects can be in a CollisionDetector group
         elif group_type == "CollisionDetectorProxy" and \
-                obj.Name.find("Collision") != -1:
-            return False
-        # Only RobRotation and RobTranslation can be in RobWorld, RobRotation
-        # and RobTRanslation groups
-        elif (group_type in ["RobWorldProxy", "RobRotationProxy",
-                             "RobTranslationProxy"]) and \
-                (obj_type in ["RobRotationProxy", "RobTranslationProxy"]):
+                obj.Name.startswith("Collision"):
             return False
         return True
 
@@ -280,10 +309,13 @@ is going to be closed.
 Args:
     doc: A FreeCAD's `App.Document` document about to be closed.
         """
-        # Check at least one server is in the document about to be closed
-        if doc.Name in self.server_proxies:
-            # Notify all servers in the document
-            for server_proxy in self.server_proxies[doc.Name]:
+        # Forget proxy class names of objects in the closed document
+        self.proxy_types.clear()
+
+        # Notify all servers still present in the document and forget them
+        for server_ref in self.server_proxies.pop(doc.Name, []):
+            server_proxy = server_ref()
+            if server_proxy is not None:
                 server_proxy.onDocumentClosed()
 
     def addServerToNotify(self, server_proxy, document_name):
@@ -299,13 +331,19 @@ Args:
         """
         # Add a server proxy to the dictionary under a document name it's on
         if document_name in self.server_proxies:
-            if server_proxy not in self.server_proxies[document_name]:
-                self.server_proxies[document_name].append(server_proxy)
+            # Drop references to deleted servers
+            server_refs = [server_ref for server_ref
+                           in self.server_proxies[document_name]
+                           if server_ref() is not None]
+            if not any(server_ref() is server_proxy
+                       for server_ref in server_refs):
+                server_refs.append(weakref.ref(server_proxy))
+            self.server_proxies[document_name] = server_refs
 
         # Add a new document name to the dictionary and assign it a list
         # with a server proxy
         else:
-            self.server_proxies[document_name] = [server_proxy]
+            self.server_proxies[document_name] = [weakref.ref(server_proxy)]
 
 
 def addObserver():
@@ -36,16 +36,77 @@ to be used in a workbench.
 import FreeCAD
 import FreeCADGui
 import json
+import numpy
+import Part
 
 from CollisionObject import CollisionProxy, ViewProviderCollisionProxy
-from PySide2.QtWidgets import QMessageBox
 from PySide2.QtCore import QTimer
+from collections import deque
 from os import path
 
 ## Path to a folder with the necessary icons.
 PATH_TO_ICONS = path.join(FreeCAD.getHomePath(), "Mod", "Animate", "Resources",
                           "Icons")
 
+## Path to the CollisionDetector icon shown in the Tree View.
+COLLISION_DETECTOR_ICON = path.join(PATH_TO_ICONS, "CollisionDetector.png")
+
+## Path to the CollisionDetector command icon shown in toolbars and menus.
+COLLISION_DETECTOR_CMD_ICON = path.join(PATH_TO_ICONS,
+                                        "CollisionDetectorCmd.png")
+
+## Levels of collision checking from the crudest to the most precise.
+CHECKING_LEVELS = ["Bounding box", "Shape distance", "Intersection volume",
+                   "Intersection volume visualizations"]
+
+## Index of the first checking level computing intersection volumes.
+INTERSECTION_VOLUME = 2
+
+## Sentinel returned by `getattr` for attributes an object doesn't have.
+MISSING = object()
+
+## Properties of a CollisionDetector as tuples of a type, a name, a group,
+# a tooltip and a default value (None to keep the property's own default).
+PROPERTIES = [
+    ("App::PropertyBool", "ValidObservedObjects", "General",
+     "All objects are valid for collision detection", False),
+    ("App::PropertyLinkListGlobal", "ObservedObjects", "General",
+     "Objects that will be checked for intersections.", None),
+    ("App::PropertyBool", "RememberCollisions", "General",
+     "Remember which objects collided and show them.", True),
+    ("App::PropertyBool", "StopAtFirstCollision", "General",
+     "Stop checking when the first collision is found\n"
+     + "and consider all other objects ok.", False),
+    ("App::PropertyEnumeration", "CheckingLevel", "General",
+     "Levels of checking from coarse and\n"
+     + "fast (Bounding box) to slow but precise\n"
+     + "(Intersection volume). To see intersected area\n"
+     + "select 'Intersection volume visualizations'", CHECKING_LEVELS),
+    # Intersection style
+    ("App::PropertyColor", "IntersectionColor", "IntersectionStyle",
+     "Color for highlighting intersections.", (1.0, 0.0, 0.0)),
+    # Style of objects in collision
+    ("App::PropertyPercent", "InCollisionTransparency", "In-CollisionStyle",
+     "Transparency set to objects in collision.", 50),
+    ("App::PropertyColor", "InCollisionShapeColor", "In-CollisionStyle",
+     "Shape color for highlighting objects in collision.",
+     (1.0, 0.667, 0.333)),
+    ("App::PropertyColor", "InCollisionLineColor", "In-CollisionStyle",
+     "Line color for highlighting objects in collision.", (1.0, 0.667, 0.0)),
+    ("App::PropertyFloatConstraint", "InCollisionLineWidth",
+     "In-CollisionStyle", "Line width for highlighting objects\n"
+     + "in collision. Range is < 1 | 64 >.", (2, 1, 64, 1)),
+    # Style of collided objects
+    ("App::PropertyPercent", "CollidedTransparency", "CollidedStyle",
+     "Transparency set to collided objects.", 50),
+    ("App::PropertyColor", "CollidedShapeColor", "CollidedStyle",
+     "Color for highlighting objects which collided.", (0.667, 0.333, 1.0)),
+    ("App::PropertyColor", "CollidedLineColor", "CollidedStyle",
+     "Line color for highlighting objects in collision.", (0.667, 0.0, 1.0)),
+    ("App::PropertyFloatConstraint", "CollidedLineWidth", "CollidedStyle",
+     "Line width for highlighting objects\n"
+     + "in collision. Range is < 1 | 64 >.", (2, 1, 64, 1))]
+
 
 class CollisionDetectorProxy(object):
     """
@@ -56,12 +117,23 @@ a `DocumentObjectGroupPython` CollisionDetector instance and responds to theirs
 changes. It detects collisions among `ObservedObjects`.
 
 Attributes:
-    command_queue: A list of commands interfering with Coin3D to execute later.
+    command_queue: A deque of commands interfering with Coin3D to execute
+        later.
+    queue_scheduled: A flag to signal execution of the queue is scheduled.
     observed_objects_before: An `ObservedObjects` property before change.
-    in_collision: A set of objects which are in-collision together.
-    collided: A set of objects which have collided since the last reset.
-    original_styles: A dict of objects and their style original style.
-    shape_info: A dict of objects, `Part object`s inside them and fused shapes.
+    in_collision: A set of names of objects which are in-collision together.
+    collided: A set of names of objects which have collided since the last
+        reset.
+    original_transparency: A dict of object names and original Transparency.
+    original_shape_color: A dict of object names and original ShapeColor.
+    original_line_color: A dict of object names and original LineColor.
+    original_line_width: A dict of object names and original LineWidth.
+    shape_info: A dict of object names, `Part object`s inside the objects and
+        fused shapes.
+        Group objects also keep the last fused shape under "fused" and the
+        shapes it was fused from under "fused_from". Shapes and placement
+        from the last check are kept under "placed" and a bounding box
+        under "box".
     fp: A `DocumentObjectGroupPython` associated with the proxy.
     checking: A flag to signal collision checking is in progress.
     resetting: A flag to signal resetting objects to previous state.
@@ -73,7 +145,6 @@ CollisionDetector do:
                           "CollisionDetector")
         CollisionDetectorProxy(a)
     """
-    command_queue = []
 
     def __init__(self, fp):
         """
@@ -131,16 +202,15 @@ Args:
         # Check if an object was deleted/added from the ObservedObjects
         # and reset it to the original style/remember its style
         if prop == "ObservedObjects":
-            removed_objects = set(self.observed_objects_before)\
-                - set(fp.ObservedObjects)
-            for obj in removed_objects:
-                self.resetObject(obj)
-            added_objects = set(fp.ObservedObjects) \
-                - set(self.shape_info.keys())
-            self.loadObjects(added_objects)
+            observed = {obj.Name: obj for obj in fp.ObservedObjects}
+            for obj in self.observed_objects_before:
+                if obj.Name not in observed:
+                    self.resetObject(obj)
+            shape_info = self.shape_info
+            self.loadObjects([obj for name, obj in observed.items()
+                              if name not in shape_info])
             # remember if all observed objects are valid
-            fp.ValidObservedObjects = (set(self.shape_info.keys())
-                                       == set(fp.ObservedObjects))
+            fp.ValidObservedObjects = shape_info.keys() == observed.keys()
 
     def resetObject(self, object_):
         """
@@ -154,16 +224,78 @@ Args:
     object_: An observed object.
         """
         # Check that object to be reset has shape info recorded.
-        if object_ in self.shape_info.keys():
-            # Go through all 'Part objects' inside
-            for obj in self.shape_info.pop(object_)["objects"]:
-                # Reset styles
-                if obj.Name in self.original_styles.keys():
-                    style = self.original_styles.pop(obj.Name)
-                    obj.ViewObject.Transparency = style["Transparency"]
-                    obj.ViewObject.ShapeColor = tuple(style["ShapeColor"])
-                    obj.ViewObject.LineColor = tuple(style["LineColor"])
-                    obj.ViewObject.LineWidth = style["LineWidth"]
+        info = self.shape_info.pop(object_.Name, None)
+        if info is None:
+            return
+
+        # Go through all 'Part objects' inside and reset their styles
+        for obj in info["objects"]:
+            if obj.Name in self.original_transparency:
+                self.restoreStyle(obj)
+                self.forgetStyle(obj.Name)
+
+    def saveStyle(self, obj):
+        """
+Method to remember the original style of a `Part object`.
+
+Args:
+    obj: A `Part object` whose style is going to be changed.
+        """
+        vo = obj.ViewObject
+        name = obj.Name
+        self.original_transparency[name] = vo.Transparency
+        self.original_shape_color[name] = vo.ShapeColor
+        self.original_line_color[name] = vo.LineColor
+        self.original_line_width[name] = vo.LineWidth
+
+    def restoreStyle(self, obj):
+        """
+Method to return a `Part object` to its remembered original style.
+
+Args:
+    obj: A `Part object` with a remembered style.
+        """
+        name = obj.Name
+        self.setStyle(obj, self.original_transparency[name],
+                      tuple(self.original_shape_color[name]),
+                      tuple(self.original_line_color[name]),
+                      self.original_line_width[name])
+
+    def setStyle(self, obj, transparency, shape_color, line_color, line_width):
+        """
+Method to set a style of a `Part object`.
+
+Only style properties which differ from the new values are written, so that
+an unchanged style doesn't cause scene graph updates.
+
+Args:
+    obj: A `Part object` to be styled.
+    transparency: An int Transparency to set.
+    shape_color: A tuple ShapeColor to set.
+    line_color: A tuple LineColor to set.
+    line_width: A float LineWidth to set.
+        """
+        vo = obj.ViewObject
+        if vo.Transparency != transparency:
+            vo.Transparency = transparency
+        if vo.ShapeColor != shape_color:
+            vo.ShapeColor = shape_color
+        if vo.LineColor != line_color:
+            vo.LineColor = line_color
+        if vo.LineWidth != line_width:
+            vo.LineWidth = line_width
+
+    def forgetStyle(self, name):
+        """
+Method to forget the original style of a `Part object`.
+
+Args:
+    name: A str name of a `Part object` with a remembered style.
+        """
+        del self.original_transparency[name]
+        del self.original_shape_color[name]
+        del self.original_line_color[name]
+        del self.original_line_width[name]
 
     def loadObjects(self, objects, save_style=True):
         """
@@ -175,10 +307,13 @@ the shape_info dictionary. Their styles are recorded.
 Args:
     objects: A list or set of added objects.
         """
+        shape_info = self.shape_info
         # Go through objects
         for obj in objects:
+            shape = getattr(obj, "Shape", MISSING)
             # Invalid object - No shape nor group
-            if not hasattr(obj, "Shape") and not hasattr(obj, "Group"):
+            if shape is MISSING and getattr(obj, "Group", MISSING) is MISSING:
+                from PySide2.QtWidgets import QMessageBox
                 QMessageBox.warning(
                     None,
                     'Error while checking collisions',
@@ -187,20 +322,17 @@ Args:
                     + "It is not possible to check its collisions.\n"
                     + "Remove it from the observed objects.")
             # Group object
-            elif not hasattr(obj, "Shape") and hasattr(obj, "Group"):
+            elif shape is MISSING:
                 # Explore it
                 groupobjects, groupshape = self.exploreGroup(obj)
                 if groupshape is not None:
-                    self.shape_info[obj] = {"objects": groupobjects,
+                    shape_info[obj.Name] = {"objects": groupobjects,
                                             "shape": groupshape}
                     if save_style:
-                        for obj in groupobjects:
-                            self.original_styles[obj.Name] = {
-                                "Transparency": obj.ViewObject.Transparency,
-                                "ShapeColor": obj.ViewObject.ShapeColor,
-                                "LineColor": obj.ViewObject.LineColor,
-                                "LineWidth": obj.ViewObject.LineWidth}
+                        for group_obj in groupobjects:
+                            self.saveStyle(group_obj)
                 else:
+                    from PySide2.QtWidgets import QMessageBox
                     QMessageBox.warning(
                         None,
                         'Error while checking collisions',
@@ -210,14 +342,9 @@ Args:
                         + "Remove it from the observed objects.")
             # Regular object
             else:
-                self.shape_info[obj] = {"objects": [obj],
-                                        "shape": obj.Shape}
+                shape_info[obj.Name] = {"objects": [obj], "shape": shape}
                 if save_style:
-                    self.original_styles[obj.Name] = {
-                        "Transparency": obj.ViewObject.Transparency,
-                        "ShapeColor": obj.ViewObject.ShapeColor,
-                        "LineColor": obj.ViewObject.LineColor,
-                        "LineWidth": obj.ViewObject.LineWidth}
+                    self.saveStyle(obj)
 
     def execute(self, fp):
         """
@@ -240,118 +367,40 @@ The properties are set if they are not already present and an
 Args:
     fp: A restored or barebone CollisionDetector object.
         """
-        if not hasattr(fp, "ValidObservedObjects"):
-            fp.addProperty(
-                "App::PropertyBool", "ValidObservedObjects", "General",
-                "All objects are valid for collision detection"
-                ).ValidObservedObjects = False
-        # Add (and preset) properties
-        if not hasattr(fp, "ObservedObjects"):
-            fp.addProperty(
-                "App::PropertyLinkListGlobal", "ObservedObjects", "General",
-                "Objects that will be checked for intersections.")
-        if not hasattr(fp, "RememberCollisions"):
-            fp.addProperty(
-                "App::PropertyBool", "RememberCollisions", "General",
-                "Remember which objects collided and show them."
-                ).RememberCollisions = True
-        if not hasattr(fp, "CheckingLevel"):
-            fp.addProperty("App::PropertyEnumeration", "CheckingLevel",
-                           "General", "Levels of checking from coarse and\n"
-                           + "fast (Bounding box) to slow but precise\n"
-                           + "(Intersection volume). To see intersected area\n"
-                           + "select 'Intersection volume visualizations'")
-            fp.CheckingLevel = ["Bounding box",
-                                "Shape distance",
-                                "Intersection volume",
-                                "Intersection volume visualizations"]
-        # Intersection style
-        if not hasattr(fp, "IntersectionColor"):
-            fp.addProperty(
-                "App::PropertyColor", "IntersectionColor", "IntersectionStyle",
-                "Color for highlighting intersections."
-                ).IntersectionColor = (1.0, 0.0, 0.0)
-
-        # Style of objects in collision
-        if not hasattr(fp, "InCollisionTransparency"):
-            fp.addProperty(
-                "App::PropertyPercent", "InCollisionTransparency",
-                "In-CollisionStyle",
-                "Transparency set to objects in collision."
-                ).InCollisionTransparency = 50
-        if not hasattr(fp, "InCollisionShapeColor"):
-            fp.addProperty(
-                "App::PropertyColor", "InCollisionShapeColor",
-                "In-CollisionStyle",
-                "Shape color for highlighting objects in collision."
-                ).InCollisionShapeColor = (1.0, 0.667, 0.333)
-        if not hasattr(fp, "InCollisionLineColor"):
-            fp.addProperty(
-                "App::PropertyColor", "InCollisionLineColor",
-                "In-CollisionStyle",
-                "Line color for highlighting objects in collision."
-                ).InCollisionLineColor = (1.0, 0.667, 0.0)
-        if not hasattr(fp, "InCollisionLineWidth"):
-            fp.addProperty(
-                "App::PropertyFloatConstraint", "InCollisionLineWidth",
-                "In-CollisionStyle",
-                "Line width for highlighting objects\n"
-                + "in collision. Range is < 1 | 64 >."
-                ).InCollisionLineWidth = (2, 1, 64, 1)
-        else:
-            fp.InCollisionLineWidth = (fp.InCollisionLineWidth, 2, 64, 1)
-
-        # Style of collided objects
-        if not hasattr(fp, "CollidedTransparency"):
-            fp.addProperty(
-                "App::PropertyPercent", "CollidedTransparency",
-                "CollidedStyle", "Transparency set to collided objects."
-                ).CollidedTransparency = 50
-        if not hasattr(fp, "CollidedShapeColor"):
-            fp.addProperty(
-                "App::PropertyColor", "CollidedShapeColor", "CollidedStyle",
-                "Color for highlighting objects which collided."
-                ).CollidedShapeColor = (0.667, 0.333, 1.0)
-        if not hasattr(fp, "CollidedLineColor"):
-            fp.addProperty(
-                "App::PropertyColor", "CollidedLineColor",
-                "CollidedStyle",
-                "Line color for highlighting objects in collision."
-                ).CollidedLineColor = (0.667, 0.0, 1.0)
-        if not hasattr(fp, "CollidedLineWidth"):
-            fp.addProperty(
-                "App::PropertyFloatConstraint",
-                "CollidedLineWidth", "CollidedStyle",
-                "Line width for highlighting objects"
-                + "in collision. Range is < 1 | 64 >."
-                ).CollidedLineWidth = (2, 1, 64, 1)
-        else:
-            fp.CollidedLineWidth = (fp.CollidedLineWidth, 2, 64, 1)
-
-        if not hasattr(self, "in_collision") or \
-                (hasattr(self, "in_collision") and self.in_collision is None):
+        # Add (and preset) properties not already present on the object
+        properties = set(fp.PropertiesList)
+        for prop_type, name, group, doc, default in PROPERTIES:
+            if name not in properties:
+                fp.addProperty(prop_type, name, group, doc)
+                if default is not None:
+                    setattr(fp, name, default)
+            # Restore constraints of float properties
+            elif prop_type == "App::PropertyFloatConstraint":
+                setattr(fp, name, (getattr(fp, name),) + default[1:])
+
+        if getattr(self, "in_collision", None) is None:
             self.in_collision = set()
-        if not hasattr(self, "collided") or \
-                (hasattr(self, "collided") and self.collided is None):
+        if getattr(self, "collided", None) is None:
             self.collided = set()
-        if not hasattr(self, "original_styles") or \
-                (hasattr(self, "original_styles") and
-                 self.original_styles is None):
-            self.original_styles = dict()
-        if not hasattr(self, "shape_info") or \
-                (hasattr(self, "shape_info") and
-                 self.shape_info is None):
+        if getattr(self, "original_transparency", None) is None:
+            self.original_transparency = dict()
+            self.original_shape_color = dict()
+            self.original_line_color = dict()
+            self.original_line_width = dict()
+        if getattr(self, "shape_info", None) is None:
             self.shape_info = dict()
             self.loadObjects(fp.ObservedObjects, save_style=False)
 
         self.fp = fp
         self.checking = False
         self.resetting = False
+        self.command_queue = deque()
+        self.queue_scheduled = False
 
         fp.setEditorMode("Group", 1)
         fp.setEditorMode("ValidObservedObjects", 2)
-        fp.ValidObservedObjects = (set(self.shape_info.keys())
-                                   == set(fp.ObservedObjects))
+        fp.ValidObservedObjects = \
+            self.shape_info.keys() == {obj.Name for obj in fp.ObservedObjects}
 
         import AnimateDocumentObserver
         AnimateDocumentObserver.addObserver()
@@ -365,6 +414,7 @@ the collision checking is started.
         """
         # Don't check if there are invalid objects
         if not self.fp.ValidObservedObjects:
+            from PySide2.QtWidgets import QMessageBox
             QMessageBox.warning(
                     None,
                     'Error while checking collisions',
@@ -402,146 +452,332 @@ the collision checking is started.
         elif len(self.fp.ObservedObjects) == 1:
             FreeCAD.Console.PrintWarning(
                 "CollisionDetector observes only 1 object.\n")
-            ok.add(self.fp.ObservedObjects[0])
+            ok.add(self.fp.ObservedObjects[0].Name)
             self.visualize(ok, in_collision)
             self.checking = False
             return
 
-        # Go through observed objects and update their placement
-        for obj in self.fp.ObservedObjects:
-            if len(self.shape_info[obj]["objects"]) >= 2:
-                self.shape_info[obj]["shape"] = \
-                    self.shape_info[obj]["objects"][0].Shape.fuse(
-                        [o.Shape for o in self.shape_info[obj]["objects"][1:]])
-                if hasattr(obj, "Placement"):
-                    self.shape_info[obj]["shape"].Placement.Base = \
-                        obj.Placement.Base
-                    self.shape_info[obj]["shape"].Placement.Rotation = \
-                        obj.Placement.Rotation
-
-            elif hasattr(obj, "Placement"):
-                self.shape_info[obj]["shape"] = obj.Shape
-
-        # Go through observed objects and check for intersections
-        for i in range(len(self.fp.ObservedObjects) - 1):
-            for j in range(i+1, len(self.fp.ObservedObjects)):
-                if self.intersection(self.fp.ObservedObjects[i],
-                                     self.fp.ObservedObjects[j]):
-                    in_collision.add(self.fp.ObservedObjects[i])
-                    in_collision.add(self.fp.ObservedObjects[j])
-                else:
-                    ok.add(self.fp.ObservedObjects[i])
-                    ok.add(self.fp.ObservedObjects[j])
-
-        # make ok and in-collision disjoint
-        ok.difference_update(in_collision)
+        # Go through observed objects and update shapes only of those which
+        # have moved or changed since the last check, compounds of group
+        # objects' shapes are enough to get their bounding boxes
+        observed = self.fp.ObservedObjects
+        for obj in observed:
+            info = self.shape_info[obj.Name]
+            shapes = [o.Shape for o in info["objects"]]
+            placement = getattr(obj, "Placement", None)
+            if not self.shapesChanged(info, shapes, placement):
+                continue
+            info["placed"] = (shapes, placement)
+            info["box"] = None
+            if len(shapes) >= 2:
+                info["shape"] = self.groupShape(obj, shapes, False)
+            else:
+                info["shape"] = shapes[0]
+
+        # Find pairs of objects with overlapping bounding boxes (broad phase)
+        pairs = self.overlappingPairs(observed)
+
+        # Resolve the checking level once for all the pairs
+        level = CHECKING_LEVELS.index(self.fp.CheckingLevel)
+
+        # Fuse shapes of group objects only if their intersection volume is
+        # checked, compounds are enough for bounding boxes and distances
+        if level >= INTERSECTION_VOLUME:
+            for obj in {obj.Name: obj for pair in pairs
+                        for obj in pair}.values():
+                info = self.shape_info[obj.Name]
+                if len(info["objects"]) >= 2:
+                    info["shape"] = self.groupShape(obj, info["placed"][0])
+
+        # Check only the pairs for intersections (narrow phase) with a method
+        # specific to the checking level
+        intersection = (self.boundBoxIntersection,
+                        self.distanceIntersection,
+                        self.volumeIntersection,
+                        self.visualizedVolumeIntersection)[level]
+        stop = self.fp.StopAtFirstCollision
+        for obj1, obj2 in pairs:
+            if intersection(obj1, obj2):
+                in_collision.add(obj1.Name)
+                in_collision.add(obj2.Name)
+                # Only whether anything collides is needed
+                if stop:
+                    break
+
+        # All other objects are ok
+        ok = {obj.Name for obj in observed}.difference(in_collision)
         # visualize which objects are ok/in-collision/collided
         self.visualize(ok, in_collision)
         # set checking to false after all objects are truly removed and added
         self.executeLater(None, self.setChecking, False)
 
+    def overlappingPairs(self, objects):
+        """
+Method to find pairs of objects whose bounding boxes overlap (broad phase).
+
+Bounding boxes are sorted by their lower X coordinate and swept, so that boxes
+are compared only with boxes they overlap along the X axis (sweep and prune)
+instead of with all the others. Each box is tested against all its candidates
+at once with NumPy.
+
+Args:
+    objects: A list of observed objects.
+
+Returns:
+    A list of pairs of objects with overlapping bounding boxes, each ordered as
+    in `objects`.
+        """
+        # Read bounding boxes from FreeCAD only for moved or changed objects
+        boxes = []
+        for obj in objects:
+            info = self.shape_info[obj.Name]
+            if info.get("box") is None:
+                bb = info["shape"].BoundBox
+                info["box"] = (bb.XMin, bb.YMin, bb.ZMin, bb.XMax, bb.YMax,
+                               bb.ZMax)
+            boxes.append(info["box"])
+        boxes = numpy.array(boxes, dtype=float).reshape(-1, 6)
+
+        # Sort boxes along the X axis and find where the boxes overlapping
+        # each box along the X axis end
+        order = numpy.argsort(boxes[:, 0], kind="stable")
+        boxes = boxes[order]
+        ends = numpy.searchsorted(boxes[:, 0], boxes[:, 3], side="right")
+
+        pairs = []
+        for k in range(len(boxes) - 1):
+            box = boxes[k]
+            # Boxes beginning between this box's limits along the X axis
+            candidates = boxes[k + 1:ends[k]]
+            hits = numpy.flatnonzero(
+                numpy.logical_and(candidates[:, 1:3] <= box[4:6],
+                                  candidates[:, 4:6] >= box[1:3]).all(axis=1))
+            i = order[k]
+            for j in order[k + 1 + hits]:
+                pairs.append((objects[i], objects[j]) if i < j else
+                             (objects[j], objects[i]))
+        return pairs
+
+    def shapesChanged(self, info, shapes, placement):
+        """
+Method to check whether an observed object has moved or changed.
+
+Args:
+    info: A dict with shape information about the observed object.
+    shapes: A list of current shapes of objects making up the observed object.
+    placement: A current `Placement` of the observed object or None.
+
+Returns:
+    True if the shapes or placement differ from the last check, else False.
+        """
+        placed = info.get("placed")
+        if placed is None or placed[1] != placement or \
+                len(placed[0]) != len(shapes):
+            return True
+        return not all(a.isSame(b) for a, b in zip(placed[0], shapes))
+
+    def groupShape(self, obj, shapes, fuse=True):
+        """
+Method to make a shape of an observed group object from shapes inside it.
+
+A fused shape is remembered and reused until a shape inside the group changes
+its geometry or placement.
+
+Args:
+    obj: An observed group object with shapes of at least two objects inside.
+    shapes: A list of the shapes inside the group object.
+    fuse: A bool - True to fuse the shapes, False to only make their compound.
+
+Returns:
+    A fused or compound shape placed as the group object.
+        """
+        info = self.shape_info[obj.Name]
+        if fuse:
+            # Fuse the shapes again only if any of them has changed
+            fused_from = info.get("fused_from")
+            if fused_from is not None and len(fused_from) == len(shapes) and \
+                    all(a.isSame(b) for a, b in zip(fused_from, shapes)):
+                shape = info["fused"]
+            else:
+                shape = shapes[0].fuse(shapes[1:])
+                info["fused"] = shape
+                info["fused_from"] = shapes
+        else:
+            shape = Part.makeCompound(shapes)
+
+        # Group has a placement property
+        if hasattr(obj, "Placement"):
+            shape.Placement = obj.Placement
+        return shape
+
     def exploreGroup(self, group):
         """
 Method to explore a `group` for all objects and shapes inside.
 
 All object in the group are added to a `groupobjects` list and their shapes
-are fused into a `groupshape`.
+are put into a compound `groupshape`.
 
 Args:
     group: A group object.
 
 Returns:
     groupobjects: A list of objects in the `group`.
-    groupshape: A shape fused from the shapes of `groupobjects` or None.
-        """
-        # Shapes of objects in the group
-        shapes = []
-        # Objects and groups to go through
-        objects = group.Group
-        i = 0
-        while i < len(objects):
-            # Object has a shape attached
-            if hasattr(objects[i], "Shape"):
-                shapes.append(objects[i].Shape)
-
-            # Object has a group attached
-            if hasattr(objects[i], "Group"):
-                # Remove regular groups as their content is already between
-                # objects
-                if objects[i].__class__.__name__ == "DocumentObjectGroup":
-                    objects.pop(i)
-
-                # Go through content of other groups and add it
-                else:
-                    groupobjects, groupshape = self.exploreGroup(
-                            objects.pop(i))
-                    if groupshape is not None:
-                        shapes.append(groupshape)
-                        objects = objects[:i] + groupobjects + objects[i:]
-                        i += len(groupobjects) - 1
-            i += 1
-
-        # There are shapes present in the group
-        if len(shapes) != 0:
-            # There are more than 2 shapes in the group
-            if len(shapes) >= 2:
-                shape = shapes[0].fuse(shapes[1:])
+    groupshape: A compound of the shapes of `groupobjects` or None.
+        """
+        # Groups being explored with their remaining content and objects and
+        # shapes found inside them so far, the innermost group is the last
+        stack = [(group, iter(group.Group), [], [])]
+        while True:
+            current, content, objects, shapes = stack[-1]
+            obj = next(content, None)
+            if obj is not None:
+                # Object has a shape attached
+                shape = getattr(obj, "Shape", MISSING)
+                if shape is not MISSING:
+                    shapes.append(shape)
+
+                # Object has no group attached
+                if getattr(obj, "Group", MISSING) is MISSING:
+                    objects.append(obj)
+
+                # Go through content of groups except regular groups, as their
+                # content is already between objects
+                elif obj.__class__.__name__ != "DocumentObjectGroup":
+                    stack.append((obj, iter(obj.Group), [], []))
+                continue
+
+            # Whole group was explored, compound shapes present in it
+            stack.pop()
+            if len(shapes) == 0:
+                shape = None
             else:
-                shape = shapes[0]
+                # There are more than 2 shapes in the group
+                if len(shapes) >= 2:
+                    shape = Part.makeCompound(shapes)
+                else:
+                    shape = shapes[0]
 
-            # Group has a placement property
-            if hasattr(group, "Placement"):
-                shape.Placement = group.Placement
-            return objects, shape
+                # Group has a placement property
+                if hasattr(current, "Placement"):
+                    shape.Placement = current.Placement
 
-        # No shapes in the group
-        else:
-            return objects, None
+            # Return the explored group or add its content to the outer group
+            if len(stack) == 0:
+                return objects, shape
+            elif shape is not None:
+                stack[-1][2].extend(objects)
+                stack[-1][3].append(shape)
 
-    def intersection(self, obj1, obj2):
+    def boundBoxIntersection(self, obj1, obj2):
         """
-Method to check intersection between `obj1` and `obj2`.
+Method to check intersection of `obj1` and `obj2` at Bounding box level.
 
-Based on selected checking level this method checks for collisions and makes
-an intersection object if required.
+The objects' bounding boxes are already known to overlap from the broad phase
+in `overlappingPairs`, which is enough for the crudest level.
 
 Args:
     obj1: An object to check for a mutual intersection.
     obj2: Another object to check for a mutual intersection.
 
 Returns:
-    groupobjects: A list of objects in the `group`.
-    groupshape: A shape fused from the shapes of `groupobjects` or None.
+    True, as the objects' bounding boxes intersect.
         """
-        # Check Bounding box is intersecting (the fastest and crudest)
-        if not self.shape_info[obj1]["shape"].BoundBox.intersect(
-                self.shape_info[obj2]["shape"].BoundBox):
-            return False
+        return True
+
+    def distanceIntersection(self, obj1, obj2):
+        """
+Method to check intersection of `obj1` and `obj2` at Shape distance level.
+
+Args:
+    obj1: An object to check for a mutual intersection.
+    obj2: Another object to check for a mutual intersection.
+
+Returns:
+    True if the shortest distance between the objects' shapes is 0.
+        """
+        shape1, shape2 = self.orderedShapes(obj1, obj2)
+        return shape1.distToShape(shape2)[0] <= 0
+
+    def volumeIntersection(self, obj1, obj2):
+        """
+Method to check intersection between `obj1` and `obj2` by intersection volume.
+
+Args:
+    obj1: An object to check for a mutual intersection.
+    obj2: Another object to check for a mutual intersection.
+
+Returns:
+    True if the objects' shapes have a common volume and False otherwise.
+        """
+        return self.commonVolume(obj1, obj2) is not None
+
+    def visualizedVolumeIntersection(self, obj1, obj2):
+        """
+Method to check intersection between `obj1` and `obj2` and show it.
+
+A Collision object showing the intersection volume is made if the objects
+intersect.
+
+Args:
+    obj1: An object to check for a mutual intersection.
+    obj2: Another object to check for a mutual intersection.
 
-        # Check the shortest distance between the shapes is 0
-        if self.fp.CheckingLevel == "Shape distance" and \
-                self.shape_info[obj1]["shape"].distToShape(
-                self.shape_info[obj2]["shape"])[0] > 0:
+Returns:
+    True if the objects' shapes have a common volume and False otherwise.
+        """
+        intersection = self.commonVolume(obj1, obj2)
+        if intersection is None:
             return False
 
-        # If requested, check intersection volume, and show intersection
-        if self.fp.CheckingLevel == "Intersection volume" or \
-                self.fp.CheckingLevel == "Intersection volume visualizations":
-            # Compute common volume to both objects
-            intersection = self.shape_info[obj1]["shape"].common(
-                    self.shape_info[obj2]["shape"])
-
-            # Test common volume is not 0 i.e. objects are not just touching
-            if intersection.Volume == 0:
-                return False
-
-            # Make an Collision object to show the intersection if asked for
-            if self.fp.CheckingLevel == "Intersection volume visualizations":
-                self.executeLater(None, self.makeCollisionObject,
-                                  (intersection, obj1, obj2,
-                                   self.fp.IntersectionColor))
+        # Make an Collision object to show the intersection
+        self.executeLater(None, self.makeCollisionObject,
+                          (intersection, obj1, obj2,
+                           self.fp.IntersectionColor))
         return True
 
+    def commonVolume(self, obj1, obj2):
+        """
+Method to compute a volume common to shapes of `obj1` and `obj2`.
+
+Args:
+    obj1: An object to intersect.
+    obj2: Another object to intersect.
+
+Returns:
+    A shape of the common volume or None if the objects are just touching or
+    apart.
+        """
+        shape1, shape2 = self.orderedShapes(obj1, obj2)
+        intersection = shape1.common(shape2)
+
+        # Test common volume is not 0 i.e. objects are not just touching
+        if intersection.Volume == 0:
+            return None
+        return intersection
+
+    def orderedShapes(self, obj1, obj2):
+        """
+Method to order shapes of `obj1` and `obj2` from the presumably simpler one.
+
+A shape with a smaller bounding box volume is expected to be simpler, so it
+goes first to make a receiver of distance and common volume computations.
+
+Args:
+    obj1: An object with a bounding box from the last broad phase.
+    obj2: Another object with a bounding box from the last broad phase.
+
+Returns:
+    A tuple of the two shapes, the one with a smaller bounding box first.
+        """
+        info1 = self.shape_info[obj1.Name]
+        info2 = self.shape_info[obj2.Name]
+        x1, y1, z1, X1, Y1, Z1 = info1["box"]
+        x2, y2, z2, X2, Y2, Z2 = info2["box"]
+        if (X1 - x1) * (Y1 - y1) * (Z1 - z1) <= \
+                (X2 - x2) * (Y2 - y2) * (Z2 - z2):
+            return info1["shape"], info2["shape"]
+        return info2["shape"], info1["shape"]
+
     def makeCollisionObject(self, shape, cause1, cause2, color):
         """
 Method to make a collision object and add it to the `CollisionDetector`.
@@ -568,44 +804,43 @@ Then these sets are highlighted using style properties (Transparency,
 Shape Color, Line Color, Line Width).
 
 Args:
-    ok: A set of objects that are not in-collision.
-    in_collision: A set of objects that are in-collision.
+    ok: A set of names of objects that are not in-collision.
+    in_collision: A set of names of objects that are in-collision.
         """
         # Compute which objects are no longer in collision
-        collided = self.in_collision.intersection(ok)
+        collided = self.in_collision & ok
         # Add them to a set of objects which have collided
-        self.collided = self.collided.union(collided)
+        self.collided |= collided
         # Remove objects which no longer collide from a set for such objects
-        self.in_collision.difference_update(collided)
+        self.in_collision -= collided
         # Add new object which are in-collision to the set
-        self.in_collision = self.in_collision.union(in_collision)
+        self.in_collision |= in_collision
+
+        fp = self.fp
+        shape_info = self.shape_info
+        # 'Part objects' inside collided and in-collision objects
+        collided_parts = [o for name in collided
+                          for o in shape_info[name]["objects"]]
+        in_collision_parts = [o for name in in_collision
+                              for o in shape_info[name]["objects"]]
 
         # If collided objects shall be shown
-        if self.fp.RememberCollisions:
+        if fp.RememberCollisions:
             # show them
-            for obj in collided:
-                for o in self.shape_info[obj]["objects"]:
-                    o.ViewObject.Transparency = self.fp.CollidedTransparency
-                    o.ViewObject.ShapeColor = self.fp.CollidedShapeColor
-                    o.ViewObject.LineColor = self.fp.CollidedLineColor
-                    o.ViewObject.LineWidth = self.fp.CollidedLineWidth
+            style = (fp.CollidedTransparency, fp.CollidedShapeColor,
+                     fp.CollidedLineColor, fp.CollidedLineWidth)
+            for o in collided_parts:
+                self.setStyle(o, *style)
         else:
             # otherwise reset them
-            for obj in collided:
-                for o in self.shape_info[obj]["objects"]:
-                    style = self.original_styles[obj.Name]
-                    o.ViewObject.Transparency = style["Transparency"]
-                    o.ViewObject.ShapeColor = style["ShapeColor"]
-                    o.ViewObject.LineColor = style["LineColor"]
-                    o.ViewObject.LineWidth = style["LineWidth"]
+            for o in collided_parts:
+                self.restoreStyle(o)
 
         # Show objects in-collision
-        for obj in in_collision:
-            for o in self.shape_info[obj]["objects"]:
-                o.ViewObject.Transparency = self.fp.InCollisionTransparency
-                o.ViewObject.ShapeColor = self.fp.InCollisionShapeColor
-                o.ViewObject.LineColor = self.fp.InCollisionLineColor
-                o.ViewObject.LineWidth = self.fp.InCollisionLineWidth
+        style = (fp.InCollisionTransparency, fp.InCollisionShapeColor,
+                 fp.InCollisionLineColor, fp.InCollisionLineWidth)
+        for o in in_collision_parts:
+            self.setStyle(o, *style)
 
     def reset(self):
         """
@@ -620,12 +855,8 @@ style.
         else:
             self.resetting = True
             self.executeLater(None, self.fp.removeObjectsFromDocument, None)
-            for obj_name, style in self.original_styles.items():
-                obj = FreeCAD.ActiveDocument.getObject(obj_name)
-                obj.ViewObject.Transparency = style["Transparency"]
-                obj.ViewObject.ShapeColor = tuple(style["ShapeColor"])
-                obj.ViewObject.LineColor = tuple(style["LineColor"])
-                obj.ViewObject.LineWidth = style["LineWidth"]
+            for obj_name in self.original_transparency:
+                self.restoreStyle(FreeCAD.ActiveDocument.getObject(obj_name))
             self.in_collision = set()
             self.collided = set()
             # set resetting to false after all objects are truly removed
@@ -679,7 +910,11 @@ Args:
             self.command_queue.append((var, command, ()))
         else:
             self.command_queue.append((var, command, (args,)))
-        QTimer.singleShot(0, self.executeCommandQueue)
+
+        # Schedule execution of the queue only once for all queued commands
+        if not self.queue_scheduled:
+            self.queue_scheduled = True
+            QTimer.singleShot(0, self.executeCommandQueue)
 
     def executeCommandQueue(self):
         """
@@ -692,8 +927,13 @@ Usage example:
         PySide2.QtCore.QTimer.singleShot(0, self.executeCommandQueue)
 
         """
+        # Commands queued from now on need another execution, but those
+        # queued during the execution are executed right away
+        self.queue_scheduled = False
+        command_queue = self.command_queue
         try:
-            for var, cmd, args in self.command_queue:
+            while command_queue:
+                var, cmd, args = command_queue.popleft()
                 try:
                     if var is not None:
                         cmd(*args)
@@ -707,40 +947,56 @@ Usage example:
         except ReferenceError as e:
             FreeCAD.Console.PrintLog(
                 "CollisionDetector: Deleted object in the command_queue.\n")
-        self.command_queue = []
+            command_queue.clear()
 
     def __getstate__(self):
         """
 Necessary method to save unserializable objects.
 
-We use this to save `original_styles` dictionary, `collided` and `in_collision`
-sets.
+We use this to save dictionaries of original styles, `collided` and
+`in_collision` sets.
 
 Returns:
     data: A JSON string representation of a Python data structure.
         """
-        state = {"original_styles": self.original_styles,
-                 "collided": [obj.Name for obj in self.collided],
-                 "in_collision": [obj.Name for obj in self.in_collision]}
-        data = json.JSONEncoder().encode(state)
+        state = {"original_transparency": self.original_transparency,
+                 "original_shape_color": self.original_shape_color,
+                 "original_line_color": self.original_line_color,
+                 "original_line_width": self.original_line_width,
+                 "collided": list(self.collided),
+                 "in_collision": list(self.in_collision)}
+        data = json.dumps(state, separators=(",", ":"))
         return data
 
     def __setstate__(self, data):
         """
 Necessary method to restore unserializable objects when loading document.
 
-We use this to restore `original_styles` dictionary, `collided` and
-`in_collision` sets.
+We use this to restore dictionaries of original styles, `collided` and
+`in_collision` sets. Styles saved by older versions as one `original_styles`
+dictionary are split into the separate dictionaries.
 
 Args:
     data: A JSON string representation of a Python data structure.
         """
-        state = json.JSONDecoder().decode(data)
-        self.original_styles = state["original_styles"]
-        self.collided = {FreeCAD.ActiveDocument.getObject(name)
-                         for name in state["collided"]}
-        self.in_collision = {FreeCAD.ActiveDocument.getObject(name)
-                             for name in state["in_collision"]}
+        state = json.loads(data)
+        if "original_styles" in state:
+            styles = state["original_styles"]
+            self.original_transparency = {
+                name: style["Transparency"] for name, style in styles.items()}
+            self.original_shape_color = {
+                name: style["ShapeColor"] for name, style in styles.items()}
+            self.original_line_color = {
+                name: style["LineColor"] for name, style in styles.items()}
+            self.original_line_width = {
+                name: style["LineWidth"] for name, style in styles.items()}
+        else:
+            self.original_transparency = state["original_transparency"]
+            self.original_shape_color = state["original_shape_color"]
+            self.original_line_color = state["original_line_color"]
+            self.original_line_width = state["original_line_width"]
+        self.collided = set(state["collided"])
+        self.in_collision = set(state["in_collision"])
 
 
 class ViewProviderCollisionDetectorProxy(object):
@@ -799,7 +1055,7 @@ Method used to get a path to an icon which will appear in the tree view.
 Returns:
     A path to the icon.
         """
-        return path.join(PATH_TO_ICONS, "CollisionDetector.png")
+        return COLLISION_DETECTOR_ICON
 
     def setProperties(self, vp):
         """
@@ -930,7 +1186,7 @@ Returns:
     a path to a command icon, a text to be shown in a menu and
     a tooltip message.
         """
-        return {'Pixmap': path.join(PATH_TO_ICONS, "CollisionDetectorCmd.png"),
+        return {'Pixmap': COLLISION_DETECTOR_CMD_ICON,
                 'MenuText': "CollisionDetector",
                 'ToolTip': "Create CollisionDetector instance."}
 
@@ -963,10 +1219,7 @@ a CollisionDetector instance can be created.
 Returns:
     True if buttons shall be enabled and False otherwise.
         """
-        if FreeCAD.ActiveDocument is None:
-            return False
-        else:
-            return True
+        return FreeCAD.ActiveDocument is not None
 
 
 if FreeCAD.GuiUp:
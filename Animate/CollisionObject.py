@@ -40,6 +40,15 @@ from os import path
 PATH_TO_ICONS = path.join(FreeCAD.getHomePath(), "Mod", "Animate", "Resources",
                           "Icons")
 
+## Path to the Collision icon shown in the Tree View.
+COLLISION_ICON = path.join(PATH_TO_ICONS, "Collision.png")
+
+## View properties of a Collision hidden in the Property View.
+HIDDEN_VIEW_PROPERTIES = (
+    "AngularDeflection", "BoundingBox", "Deviation", "DisplayMode",
+    "DrawStyle", "Lighting", "LineColor", "LineWidth", "PointColor",
+    "PointSize", "Selectable", "SelectionStyle", "ShapeColor")
+
 
 class CollisionProxy(object):
     """
@@ -102,11 +111,14 @@ the CollisionObject.
 Args:
     fp : A restored or barebone `FeaturePython` CollisionObject object.
         """
-        if not hasattr(fp, "CausedBy"):
+        # Properties already present on the object
+        properties = set(fp.PropertiesList)
+
+        if "CausedBy" not in properties:
             fp.addProperty(
                 "App::PropertyLinkList", "CausedBy", "Collision",
                 "Objects that made this collision").CausedBy = [cause1, cause2]
-        if not hasattr(fp, "Volume"):
+        if "Volume" not in properties:
             fp.addProperty(
                     "App::PropertyVolume", "Volume", "Collision",
                     "Overlapping volume of interfering objects."
@@ -118,8 +130,9 @@ Args:
         fp.setEditorMode("Label", 1)
 
         # Add ViewObject to __dict__ so that it can be accessed using
-        # __getattribute__
-        fp.__dict__["ViewObject"] = fp.ViewObject
+        # __getattribute__, once is enough
+        if "ViewObject" not in fp.__dict__:
+            fp.__dict__["ViewObject"] = fp.ViewObject
 
 
 class ViewProviderCollisionProxy(object):
@@ -197,7 +210,7 @@ Method used to get a path to an icon which will appear in the tree view.
 Returns:
     A path to the icon.
         """
-        return path.join(PATH_TO_ICONS, "Collision.png")
+        return COLLISION_ICON
 
     def setProperties(self, vp):
         """
@@ -209,16 +222,6 @@ All unused unnecessary `FeaturePython`s properties are hidden except for
 Args:
     vp: A `Gui.ViewProviderDocumentObject` Collision.ViewObject.
         """
-        vp.setEditorMode("AngularDeflection", 2)
-        vp.setEditorMode("BoundingBox", 2)
-        vp.setEditorMode("Deviation", 2)
-        vp.setEditorMode("DisplayMode", 2)
-        vp.setEditorMode("DrawStyle", 2)
-        vp.setEditorMode("Lighting", 2)
-        vp.setEditorMode("LineColor", 2)
-        vp.setEditorMode("LineWidth", 2)
-        vp.setEditorMode("PointColor", 2)
-        vp.setEditorMode("PointSize", 2)
-        vp.setEditorMode("Selectable", 2)
-        vp.setEditorMode("SelectionStyle", 2)
-        vp.setEditorMode("ShapeColor", 2)
+        set_editor_mode = vp.setEditorMode
+        for prop in HIDDEN_VIEW_PROPERTIES:
+            set_editor_mode(prop, 2)
@@ -34,19 +34,24 @@ a `DocumentObjectGroupPython` Control instance.
 
 import FreeCAD
 import FreeCADGui
-import numpy
 import time
 import os
-import sys
 import re
-import subprocess
 import struct
 
+from contextlib import contextmanager
+
 from PySide2.QtWidgets import QDialogButtonBox, QMessageBox, QTreeView, \
     QHBoxLayout, QPushButton
-from PySide2.QtCore import Slot, QTimer, QObject
+from PySide2.QtCore import QTimer, QObject, QProcess
 from PySide2.QtCore import Qt
 from PySide2.QtGui import QStandardItemModel, QStandardItem
+from Trajectory import TrajectoryProxy
+from CollisionDetector import CollisionDetectorProxy
+from RobWorld import RobWorldProxy
+from RobRotation import RobRotationProxy
+from RobTranslation import RobTranslationProxy
+from Server import ServerProxy
 from os import path
 
 
@@ -54,6 +59,12 @@ from os import path
 PATH_TO_ICONS = path.join(FreeCAD.getHomePath(), "Mod", "Animate", "Resources",
                         "Icons")
 
+## Path to the Control icon shown in the Tree View.
+CONTROL_ICON = path.join(PATH_TO_ICONS, "Control.png")
+
+## Path to the Control command icon shown in toolbars and menus.
+CONTROL_CMD_ICON = path.join(PATH_TO_ICONS, "ControlCmd.png")
+
 ## Path to a folder with the necessary user interface files.
 PATH_TO_UI = path.join(FreeCAD.getHomePath(), "Mod", "Animate", "Resources",
                      "UIs")
@@ -61,9 +72,67 @@ PATH_TO_UI = path.join(FreeCAD.getHomePath(), "Mod", "Animate", "Resources",
 ## Format string to format image number inside image name while recording
 NAME_NUMBER_FORMAT = "%05d"
 
+## Pattern of recorded image names with a sequence name and an image number
+SEQUENCE_IMAGE_PATTERN = re.compile(r"(seq\d+)-(\d+)(?=\.png)")
+
 ## Ancillary private safe-to-copy PNG chunk type code.
 FPS_CHUNK_CODE = b'xfPs'
 
+## Positive infinity used as an upper bound of timing properties
+POS_INF = float("inf")
+
+## Negative infinity used as a lower bound of timing properties
+NEG_INF = -POS_INF
+
+## The smallest allowed `Step Time`
+STEP_MIN = 0.01
+
+## Longest time in seconds to record frames for before the GUI is updated
+RECORD_BATCH_TIME = 0.1
+
+## Style sheet of a button confirming a sequence to export
+CONFIRM_BUTTON_STYLE = """
+    QPushButton {
+        background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                                    stop: 0 #0B0, stop: 1.0 #0D0);
+        font-weight: bold;
+    }
+    QPushButton:hover {border-color: #0D0;}
+    QPushButton:focus {
+        background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                                    stop: 0 #0C0, stop: 1.0 #0F0);
+        border-color: #0E0; color: #FFF;
+    }
+    QPushButton:pressed {
+        background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                                    stop: 0 #0F0, stop: 1.0 #0C0);
+    }"""
+
+## Style sheet of a button aborting an export
+ABORT_BUTTON_STYLE = """
+    QPushButton {
+        background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                                    stop: 0 #B00, stop: 1.0 #D00);
+        font-weight: bold;
+    }
+    QPushButton:hover {border-color: #D00;}
+    QPushButton:focus {
+        background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                                    stop: 0 #C00, stop: 1.0 #F00);
+        border-color: #E00; color: #FFF;
+    }
+    QPushButton:pressed {
+        background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                                    stop: 0 #F00, stop: 1.0 #C00);
+    }"""
+
+## Proxy classes of objects which are animated using their `Time` property
+TIMED_PROXIES = (TrajectoryProxy, RobRotationProxy, RobTranslationProxy)
+
+## Proxy classes of objects which can be dropped into a Control group
+DROPPABLE_PROXIES = (ServerProxy, TrajectoryProxy, CollisionDetectorProxy,
+                     RobWorldProxy, RobRotationProxy, RobTranslationProxy)
+
 
 class ControlPanel(QObject):
     """
@@ -74,13 +143,25 @@ an animation.
 
 Attributes:
     btn_abort: A QPushButton to abort exporting a sequence.
+    animation_disabled: A bool - True if Active View's animation is disabled.
     btn_confirm: A QPushButton to confirm sequence to export.
+    collision_detectors: A list of CollisionDetector children during
+        an animation or None.
     control_proxy: A proxy to an associated `Control` class.
+    deadline: A float clock time at which the current frame should be shown.
+    export_process: A QProcess converting a sequence into a video or None.
     form: A QDialog instance show in the TaskView.
+    frame_progress: A list of seek slider positions of precomputed frames.
+    frame_times: A list of animation times of precomputed frames.
+    next_frame: A tuple with a method and an index of the next frame to show.
+    image_path_template: A str %-format template of recorded image paths.
     image_number: An int number of a next recorded image.
     last_clicked: A str showing which button was pressed last.
+    last_buttons_state: A `last_clicked` str the buttons were last set for.
     lyt_export: A QHBoxLayout with a `confirm` and `abort` buttons.
-    record_prefix: A str prefix for an image file name.
+    scrub_time: A float animation time the seek slider was last moved to.
+    scrub_timer: A QTimer coalescing seek slider changes into one update.
+    timed_objects: A list of timed children during an animation or None.
     timer: A QTimer for timing animations.
     trv_sequences: A QTreeView showing list of recorded sequences.
 
@@ -108,8 +189,9 @@ Args:
         self.control_proxy = control_proxy
 
         # Disable editing of Control properties
-        for prop in self.control_proxy.PropertiesList:
-            self.control_proxy.setEditorMode(prop, 1)
+        control = self.control_proxy
+        for prop in control.PropertiesList:
+            control.setEditorMode(prop, 1)
 
         # Add QDialog to be displayed in freeCAD
         self.form = form
@@ -123,10 +205,30 @@ Args:
         self.form.sld_seek.valueChanged.connect(self.sliderChanged)
 
         # Create timer for the animations
+        self.animation_disabled = False
+        self.timed_objects = None
+        self.collision_detectors = None
+        self.deadline = None
+        self.next_frame = None
+        self.frame_times = []
+        self.frame_progress = []
         self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.timerTimeout)
+
+        # Create timer to show only the last of quickly repeated slider changes
+        self.scrub_time = None
+        self.scrub_timer = QTimer(self)
+        self.scrub_timer.setSingleShot(True)
+        self.scrub_timer.setInterval(40)
+        self.scrub_timer.timeout.connect(self.scrubTimeout)
+
+        # No video is being exported when the panel is opened
+        self.export_process = None
 
         # Disable pause button as animation is not running when the panel is
         # opened
+        self.last_buttons_state = None
         self.last_clicked = "pause"
         self.setInvalidButtons()
 
@@ -142,7 +244,7 @@ the slider and an animation is played.
         # Disable everything except for the pause button
         self.last_clicked = "play"
         self.setInvalidButtons()
-        FreeCADGui.ActiveDocument.ActiveView.setAnimationEnabled(False)
+        self.disableViewAnimation()
 
         # Check that we are not already at the end of an animation range
         if self.form.sld_seek.value() == self.form.sld_seek.maximum():
@@ -151,25 +253,45 @@ the slider and an animation is played.
                                 "The animation is at the end.")
             self.pauseClicked()
         else:
-            # Reset collisions
+            # Drop a pending slider change and reset collisions
+            self.scrub_timer.stop()
+            self.snapshotChildren()
             self.resetCollisions()
             # Load current time from the time slider and start playing
-            t = self.form.sld_seek.value() \
-                * (self.control_proxy.StopTime
-                   - self.control_proxy.StartTime) / 100 \
-                + self.control_proxy.StartTime
-            self.play(t)
+            t = self.sliderTime()
+            self.prebake(t, forward=True)
+            self.prepareTimer()
+            self.play(0)
 
     def pauseClicked(self):
         """
 Feedback method called when pause button was clicked.
 
-Invalid buttons are disabled in this method and that's it.
+Invalid buttons are disabled, a timer showing the next frame is stopped and
+frames and poses precomputed for the animation are dropped.
         """
         # Enable everything except for the pause button
         self.last_clicked = "pause"
         self.setInvalidButtons()
 
+        # Stop showing frames and let the timer be coarse again
+        self.timer.stop()
+        self.timer.setTimerType(Qt.CoarseTimer)
+
+        # Active View may change before next animation, check it again then
+        self.animation_disabled = False
+
+        # Drop poses precomputed for frames which won't be shown anymore
+        for obj in self.timed_objects or []:
+            if isinstance(obj.Proxy, TrajectoryProxy):
+                obj.Proxy.baked_poses = {}
+        self.frame_times = []
+        self.frame_progress = []
+
+        # Children may change before next animation, find them again then
+        self.timed_objects = None
+        self.collision_detectors = None
+
     def rewindClicked(self):
         """
 Feedback method called when rewind button was clicked.
@@ -182,7 +304,7 @@ the slider and an animation is played.
         # Disable everything except for the pause button
         self.last_clicked = "rewind"
         self.setInvalidButtons()
-        FreeCADGui.ActiveDocument.ActiveView.setAnimationEnabled(False)
+        self.disableViewAnimation()
 
         # Check that we are not already at the start of an animation range
         if self.form.sld_seek.value() == self.form.sld_seek.minimum():
@@ -191,14 +313,15 @@ the slider and an animation is played.
                                 "The animation is at the beginning.")
             self.pauseClicked()
         else:
-            # Reset collisions
+            # Drop a pending slider change and reset collisions
+            self.scrub_timer.stop()
+            self.snapshotChildren()
             self.resetCollisions()
             # Load current time from the time slider and start rewinding
-            t = self.form.sld_seek.value() \
-                * (self.control_proxy.StopTime
-                   - self.control_proxy.StartTime) / 100 \
-                + self.control_proxy.StartTime
-            self.rewind(t)
+            t = self.sliderTime()
+            self.prebake(t, forward=False)
+            self.prepareTimer()
+            self.play(0)
 
     def recordClicked(self):
         """
@@ -214,11 +337,15 @@ animation is played/recorded.
         self.last_clicked = "record"
         self.setInvalidButtons()
 
-        # Create an unique prefix for the image files which will be made
-        self.record_prefix = "seq" + time.strftime("%Y%m%d%H%M%S") + "-"
+        # Create a path template with an unique prefix for the image files
+        # which will be made, so that only an image number is formatted in
+        self.image_path_template = path.join(
+            self.control_proxy.ExportPath.replace("%", "%%"),
+            "seq" + time.strftime("%Y%m%d%H%M%S") + "-" + NAME_NUMBER_FORMAT
+            + ".png")
         # Reset image number for new image sequence
         self.image_number = 0
-        FreeCADGui.ActiveDocument.ActiveView.setAnimationEnabled(False)
+        self.disableViewAnimation()
 
         # Check that we are not already at the end of an animation range
         if self.form.sld_seek.value() == self.form.sld_seek.maximum():
@@ -237,14 +364,15 @@ animation is played/recorded.
             self.pauseClicked()
 
         else:
-            # Reset collisions
+            # Drop a pending slider change and reset collisions
+            self.scrub_timer.stop()
+            self.snapshotChildren()
             self.resetCollisions()
             # Load current time from the time slider and start recording
-            t = self.form.sld_seek.value() \
-                * (self.control_proxy.StopTime
-                   - self.control_proxy.StartTime) / 100 \
-                + self.control_proxy.StartTime
-            self.record(t)
+            t = self.sliderTime()
+            self.prebake(t, forward=True)
+            self.prepareTimer()
+            self.record(0)
 
     def exportClicked(self):
         """
@@ -268,15 +396,13 @@ cancel the selection.
         self.last_clicked = "export"
         self.setInvalidButtons()
 
-        # Try to load file names from an export folder
+        # Find all recorded sequences between files in an export folder
         try:
-            files = os.listdir(self.control_proxy.ExportPath)
+            sequences = self.findSequences(self.control_proxy.ExportPath)
         except FileNotFoundError as e:
             QMessageBox.warning(None, 'Export Path error', str(e))
             return
 
-        # Find all recorded sequences between the files
-        sequences = self.findSequences(files)
         if sequences != {}:
             # Show them in an export menu
             self.showSequences(sequences)
@@ -292,43 +418,45 @@ cancel the selection.
 Feedback method called when slider position is changed.
 
 If slider is enabled (not used to show animation time) and slider position is
-changed, time is extrapolated from slider position and animation in that time
-is shown.
+changed, time is extrapolated from slider position and a scrub timer is
+(re)started so that the animation is shown only once the slider stops moving.
         """
         # Check if the slider is enabled i.e. the change is an user input,
         # not a visualization of animation progress
         if self.form.sld_seek.isEnabled():
-            # Load current time from the time slider and show it.
-            t = self.form.sld_seek.value() \
-                * (self.control_proxy.StopTime
-                   - self.control_proxy.StartTime) / 100 \
-                + self.control_proxy.StartTime
-            self.distributeTime(t)
-            self.updateCollisions()
-            self.showChanges()
+            # Load current time from the time slider and show it later
+            self.scrub_time = self.sliderTime()
+            self.scrub_timer.start()
+
+    def scrubTimeout(self):
+        """
+Feedback method called when the seek slider stopped moving for a while.
+
+Animation at the time extrapolated from the last slider position is shown.
+        """
+        self.showFrame(self.scrub_time, repaint=True)
 
     def setInvalidButtons(self):
         """
 Method to enable/disable buttons according to a `last clicked` button.
 
 If `pause` button was pressed, all others buttons are disabled. If any other
-button was pressed, only `pause` button is left enabled.
+button was pressed, only `pause` button is left enabled. Nothing is done if
+the buttons are already set for the `last clicked` button.
         """
+        # Don't touch the buttons if they already correspond to the state
+        if self.last_clicked == self.last_buttons_state:
+            return
+
         # Disable invalid buttons with respect to the last clicked button
-        self.form.btn_play.setEnabled(self.last_clicked == "pause" and
-                                      self.last_clicked != "export")
-        self.form.btn_pause.setEnabled(self.last_clicked != "pause" and
-                                       self.last_clicked != "export")
-        self.form.btn_rewind.setEnabled(self.last_clicked == "pause" and
-                                        self.last_clicked != "export")
-        self.form.btn_record.setEnabled(self.last_clicked == "pause" and
-                                        self.last_clicked != "export")
-        self.form.btn_export.setEnabled(self.last_clicked == "pause" and
-                                        self.last_clicked != "export")
-        self.form.lbl_seek.setEnabled(self.last_clicked == "pause" and
-                                      self.last_clicked != "export")
-        self.form.sld_seek.setEnabled(self.last_clicked == "pause" and
-                                      self.last_clicked != "export")
+        paused = self.last_clicked == "pause"
+        running = not paused and self.last_clicked != "export"
+        self.form.btn_pause.setEnabled(running)
+        for widget in (self.form.btn_play, self.form.btn_rewind,
+                       self.form.btn_record, self.form.btn_export,
+                       self.form.lbl_seek, self.form.sld_seek):
+            widget.setEnabled(paused)
+        self.last_buttons_state = self.last_clicked
 
     def reject(self):
         """
@@ -337,12 +465,19 @@ Feedback method called when Control panel is closing.
 Animation is stopped. Controls properties are set to be editable. Dialog is
 closed.
         """
-        # Stop animaiton, if it's running by clicking pause button
+        # Stop animaiton, if it's running by clicking pause button, and drop
+        # a pending slider change
         self.pauseClicked()
+        self.scrub_timer.stop()
+
+        # Stop a video conversion, if it's running
+        if self.export_process is not None:
+            self.exportAborted()
 
         # Allow editing of Control properties again
-        for prop in self.control_proxy.PropertiesList:
-            self.control_proxy.setEditorMode(prop, 0)
+        control = self.control_proxy
+        for prop in control.PropertiesList:
+            control.setEditorMode(prop, 0)
 
         # Delete reference to this panel from the view provider as the panel
         # will no longer exist
@@ -387,244 +522,325 @@ Returns:
         """
         return True
 
-    @Slot(float, float)
-    def play(self, t):
+    def play(self, frame):
         """
-Method to show an animation frame at an animation time `t` during playing.
+Method to show an animation frame number `frame` during playing or rewind.
 
-Current clock time is loaded. If the pause button was clicked, an animation is
-stopped. Otherwise the animation time `t` is distributed to appropriate
-children. If the animation time `t` exceeded `Stop Time`, the animation is
-stopped. Lastly next frame time is computed as well as pause time (to stick
-with real time if computation did not exceeded `Step Time`). Finally the
-timer is set to show the next animation frame after precomputed pause.
+If the pause button was clicked, an animation is stopped. Otherwise the
+animation time of the frame is distributed to appropriate children. If it was
+the last frame, the animation is stopped. Lastly pause time is computed from
+a deadline of the next frame (to stick with real time if computation did not
+exceeded `Step Time`). Finally the timer is set to show the next animation
+frame after precomputed pause.
+
+Frames are precomputed by `prebake` in the order they are shown, so rewinding
+shows them the same way as playing.
 
 Args:
-    t: An animation time to generate an animation frame at.
+    frame: An index of the frame in frames precomputed by `prebake`.
         """
-        # Load current time
-        time_ = time.time()
-
         # Check pause button was not pressed
         if self.last_clicked == "pause":
             return
 
         # Disribute the animation time to trajectories so that they change
         # positions of all animated objects
-        self.distributeTime(t)
-        self.updateCollisions()
-        self.showChanges()
+        self.showFrame(self.frame_times[frame])
 
         # Display current progress on the seek slider
-        self.form.sld_seek.setValue(
-            numpy.round(100*(t - self.control_proxy.StartTime)
-                        / (self.control_proxy.StopTime
-                           - self.control_proxy.StartTime)))
+        self.showProgress(self.frame_progress[frame])
 
-        # Stop the animation if the animation time reached a range boundary
-        if t >= self.control_proxy.StopTime:
-            self.last_clicked = "pause"
-            self.setInvalidButtons()
+        # Stop the animation if the animation reached a range boundary
+        if frame + 1 == len(self.frame_times):
+            self.pauseClicked()
             return
 
-        # Compute an animation time for the next frame
-        next_t = min(t + self.control_proxy.StepTime,
-                     self.control_proxy.StopTime)
-
-        # Compute pause period so that animaiton time roughly corresponds to
-        # the real time
-        pause = round(1000*(self.control_proxy.StepTime + time_
-                            - time.time()))
-        pause = pause*(pause > 0)
+        # Compute pause period from a deadline of the next frame so that
+        # animation time corresponds to the real time, start again from now
+        # if the deadline was missed
+        now = time.perf_counter()
+        self.deadline = max(self.deadline + self.control_proxy.StepTime, now)
+        pause = round(1000*(self.deadline - now))
 
         # Setup a timer to show next frame if animaiton wasn't paused
         if self.last_clicked != "pause":
-            self.timer.singleShot(pause, lambda: self.play(next_t))
+            self.next_frame = (self.play, frame + 1)
+            self.timer.start(pause)
 
-    @Slot(float, float)
-    def rewind(self, t):
+    def record(self, frame):
         """
-Method to show an animation frame at an animation time `t` during rewind.
+Method to show and save animation frames starting at a frame number `frame`.
 
-Current clock time is loaded. If the pause button was clicked, an animation is
-stopped. Otherwise the animation time `t` is distributed to appropriate
-children. If the animation time `t` exceeded `Stop Time`, the animation is
-stopped. Lastly next frame time is computed as well as pause time (to stick
-with real time if computation did not exceeded `Step Time`). Finally the
-timer is set to show the next animation frame after precomputed pause.
+If the pause button was clicked, an animation is stopped. Otherwise frames are
+shown and saved one after another for up to `RECORD_BATCH_TIME`, as recording
+doesn't need to stick with real time. If it was the last frame, the animation
+is stopped. Finally the timer is set to record next frames after the GUI is
+updated.
 
 Args:
-    t: An animation time to generate an animation frame at.
+    frame: An index of the first frame in frames precomputed by `prebake`.
         """
-        # Load current time
-        time_ = time.time()
-
         # Check pause button was not pressed
         if self.last_clicked == "pause":
             return
 
-        # Disribute the animation time to trajectories so that they change
-        # positions of all animated objects
-        self.distributeTime(t)
-        self.updateCollisions()
-        self.showChanges()
+        # Record frames until the batch time runs out, saved images are
+        # rendered on their own so the GUI doesn't need to be updated
+        frame_times = self.frame_times
+        last_frame = len(frame_times) - 1
+        show_frame = self.showFrame
+        save_image = self.saveImage
+        clock = time.perf_counter
+        batch_end = clock() + RECORD_BATCH_TIME
+        while True:
+            # Disribute the animation time to trajectories so that they
+            # change positions of all animated objects, save the image
+            show_frame(frame_times[frame])
+            save_image()
+
+            # Stop the animation if the animation reached a range boundary
+            if frame == last_frame:
+                self.showProgress(self.frame_progress[frame])
+                self.pauseClicked()
+                return
+
+            if clock() >= batch_end or self.last_clicked != "record":
+                break
+            frame += 1
 
         # Display current progress on the seek slider
-        self.form.sld_seek.setValue(
-                numpy.round(100*(t - self.control_proxy.StartTime)
-                            / (self.control_proxy.StopTime
-                               - self.control_proxy.StartTime)))
+        self.showProgress(self.frame_progress[frame])
 
-        # Stop the animation if the animation time reached a range boundary
-        if t <= self.control_proxy.StartTime:
-            self.last_clicked = "pause"
-            self.setInvalidButtons()
-            return
+        # Setup a timer to record next frames if animaiton wasn't paused
+        if self.last_clicked != "pause":
+            self.next_frame = (self.record, frame + 1)
+            self.timer.start(0)
+
+    def disableViewAnimation(self):
+        """
+Method to disable Active View's animation if it's not already disabled.
 
-        # Compute an animation time for the next frame
-        next_t = max(t - self.control_proxy.StepTime,
-                     self.control_proxy.StartTime)
+The animation of the Active View must be disabled to show frames correctly.
+        """
+        if not self.animation_disabled:
+            FreeCADGui.ActiveDocument.ActiveView.setAnimationEnabled(False)
+            self.animation_disabled = True
 
-        # Compute pause period so that animaiton time roughly corresponds to
-        # the real time
-        pause = round(1000*(self.control_proxy.StepTime + time_
-                            - time.time()))
-        pause = pause*(pause > 0)
+    def prepareTimer(self):
+        """
+Method to prepare the timer for showing frames of an animation.
 
-        # Setup a timer to show next frame if animaiton wasn't paused
-        if self.last_clicked != "pause":
-            self.timer.singleShot(pause, lambda: self.rewind(next_t))
+The timer is made precise and a deadline of the first frame is set to now.
+        """
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.deadline = time.perf_counter()
 
-    @Slot(float, float)
-    def record(self, t):
+    def timerTimeout(self):
         """
-Method to show and save an animation frame at an animation time `t`.
+Feedback method called when the timer timed out and the next frame is due.
 
-Current clock time is loaded. If the pause button was clicked, an animation is
-stopped. Otherwise the animation time `t` is distributed to appropriate
-children. If the animation time `t` exceeded `Stop Time`, the animation is
-stopped. Lastly next frame time is computed. Finally the timer is set to show
-the next animation frame after precomputed pause.
+The method prepared by the last shown frame is called with the next frame
+index.
+        """
+        method, frame = self.next_frame
+        method(frame)
+
+    def showProgress(self, progress):
+        """
+Method to show an animation progress on the seek slider.
+
+Signals of the slider are blocked while its position is set, so that showing
+the progress does not call `sliderChanged` every frame.
 
 Args:
-    t: An animation time to generate an animation frame at.
+    progress: An int seek slider position in percents of the animation range.
         """
-        # Check pause button was not pressed
-        if self.last_clicked == "pause":
-            return
+        slider = self.form.sld_seek
+        slider.blockSignals(True)
+        slider.setValue(progress)
+        slider.blockSignals(False)
 
-        # Disribute the animation time to trajectories so that they change
-        # positions of all animated objects, save the image
-        self.distributeTime(t)
-        self.updateCollisions()
+    def sliderTime(self):
+        """
+Method to extrapolate an animation time from the seek slider position.
 
-        # Show changes and save view
-        self.showChanges()
-        self.saveImage()
+Returns:
+    A float animation time corresponding to the seek slider position.
+        """
+        control = self.control_proxy
+        start = control.StartTime
+        return self.form.sld_seek.value() * (control.StopTime - start) / 100 \
+            + start
 
-        # Display current progress on the seek slider
-        self.form.sld_seek.setValue(
-                numpy.round(100*(t - self.control_proxy.StartTime)
-                            / (self.control_proxy.StopTime
-                               - self.control_proxy.StartTime)))
+    def prebake(self, t, forward=True):
+        """
+Method to precompute frames and poses of child Trajectories for them.
 
-        # Stop the animation if the animation time reached a range boundary
-        if t >= self.control_proxy.StopTime:
-            self.last_clicked = "pause"
-            self.setInvalidButtons()
-            return
+Animation times of all frames from a time `t` to the end (or the beginning)
+of an animation range are listed in the order they are shown during
+an animation together with corresponding seek slider positions. The times are
+passed to all `Trajectories` so that they can interpolate their poses at once
+instead of doing it frame by frame.
 
-        # Compute an animation time for the next frame
-        next_t = min(t + self.control_proxy.StepTime,
-                     self.control_proxy.StopTime)
+Args:
+    t: An animation time of the first frame.
+    forward: A bool - True if playing/recording and False if rewinding.
+        """
+        # Step through the animation range to get exact frame times
+        control = self.control_proxy
+        start = control.StartTime
+        stop = control.StopTime
+        step = control.StepTime
+        times = [t]
+        if forward:
+            while times[-1] < stop:
+                times.append(min(times[-1] + step, stop))
+        else:
+            while times[-1] > start:
+                times.append(max(times[-1] - step, start))
+        self.frame_times = times
+        span = stop - start
+        self.frame_progress = [round(100*(frame_t - start) / span)
+                               for frame_t in times]
 
-        # Setup a timer to show next frame if animaiton wasn't paused
-        if self.last_clicked != "pause":
-            self.timer.singleShot(0, lambda: self.record(next_t))
+        # Let Trajectories precompute their poses
+        for obj in self.timedObjects():
+            if isinstance(obj.Proxy, TrajectoryProxy):
+                obj.Proxy.bake_poses(obj, times)
+
+    def showFrame(self, t, repaint=False):
+        """
+Method to show an animation frame at an animation time `t`.
+
+The time is distributed to children, collisions are updated and the document
+is recomputed once for all of the changes.
+
+Args:
+    t: An animation time to show an animation frame at.
+    repaint: A bool - True if the GUI should be updated right away.
+        """
+        self.distributeTime(t)
+        self.updateCollisions()
+        self.showChanges(repaint)
 
     def distributeTime(self, t):
         """
 Method to distribute a time `t` to children Trajectories.
 
-List of children is loaded. If a child is `Trajectory`, the time is set to it
-and its children are added to the list.
+The time is set to all timed children (unless they already have it) from
+the top of the tree down.
 
 Args:
     t: A time to distribute to all child `Trajectories`.
         """
+        for obj in self.timedObjects():
+            # Setting the same time would only recompute the same pose
+            if obj.Time != t:
+                obj.Time = t
+
+    def timedObjects(self):
+        """
+Method to list children animated using their `Time` property.
+
+Children snapshot by `snapshotChildren` are returned while an animation runs.
+Otherwise list of children is loaded as a stack. If a child is `Trajectory`,
+it's listed and its children are pushed onto the stack.
+
+Returns:
+    A list of timed objects in the order the time is distributed to them.
+        """
+        if self.timed_objects is not None:
+            return self.timed_objects
+
         # Load list of objects inside Control group
         objects = self.control_proxy.Group
 
-        # Go through them, their children and update time,
-        # if they are Trajectories
-        while len(objects) > 0:
-            obj = objects.pop(0)
-            if obj.Proxy.__class__.__name__ == "TrajectoryProxy" or \
-               obj.Proxy.__class__.__name__ == "RobRotationProxy" or \
-               obj.Proxy.__class__.__name__ == "RobTranslationProxy":
-                obj.Time = t
-                objects += obj.Group
-            elif obj.Proxy.__class__.__name__ == "RobWorldProxy":
-                objects += obj.Group
+        # Go through them, their children and list them, if they are
+        # Trajectories
+        timed_objects = []
+        while objects:
+            obj = objects.pop()
+            if isinstance(obj.Proxy, TIMED_PROXIES):
+                timed_objects.append(obj)
+                objects.extend(obj.Group)
+            elif isinstance(obj.Proxy, RobWorldProxy):
+                objects.extend(obj.Group)
+        return timed_objects
+
+    def collisionDetectors(self):
+        """
+Method to list CollisionDetector children.
+
+Children snapshot by `snapshotChildren` are returned while an animation runs.
+
+Returns:
+    A list of CollisionDetector objects inside the Control group.
+        """
+        if self.collision_detectors is not None:
+            return self.collision_detectors
+        return [obj for obj in self.control_proxy.Group
+                if isinstance(obj.Proxy, CollisionDetectorProxy)]
+
+    def snapshotChildren(self):
+        """
+Method to remember children for an animation about to run.
+
+Children can't change during an animation, so they are found only once instead
+of every frame. The snapshot is dropped when the animation is paused.
+        """
+        self.timed_objects = None
+        self.collision_detectors = None
+        self.timed_objects = self.timedObjects()
+        self.collision_detectors = self.collisionDetectors()
 
     def updateCollisions(self):
         """
 Method to update collisions from CollisionDetector children.
 
-List of children is loaded. If a child is `CollisionDetector`, it's touched so
-that it's recomputed.
+All `CollisionDetector` children are touched so that they are recomputed.
         """
-        # Load list of objects inside Control group
-        objects = self.control_proxy.Group
-
-        # if they are CollisionDetectors, then check for collisions
-        while len(objects) > 0:
-            obj = objects.pop(0)
-            if obj.Proxy.__class__.__name__ == "CollisionDetectorProxy":
-                obj.touch()
+        for obj in self.collisionDetectors():
+            obj.touch()
 
     def resetCollisions(self):
         """
 Method to reset collisions from CollisionDetector children.
 
-List of children is loaded. If a child is `CollisionDetector`, it's reset.
+All `CollisionDetector` children are reset.
         """
-        # Load list of objects inside Control group
-        objects = self.control_proxy.Group
-
-        # if they are CollisionDetectors, then check for collisions
-        while len(objects) > 0:
-            obj = objects.pop(0)
-            if obj.Proxy.__class__.__name__ == "CollisionDetectorProxy":
-                obj.Proxy.reset()
+        for obj in self.collisionDetectors():
+            obj.Proxy.reset()
 
-    def showChanges(self):
+    def showChanges(self, repaint=True):
         """
 Method to show changes made to objects, collisions.
 
 This method is necessary to call after `distributeTime`, `updateCollisions` and
-`resetCollisions`.
+`resetCollisions`. The document is recomputed and if asked for, the GUI is
+updated immediately. Animation frames don't need that as control returns to
+the event loop between them and a saved image is rendered on its own.
+
+Args:
+    repaint: A bool - True if the GUI should be updated right away.
         """
         FreeCAD.ActiveDocument.recompute()
-        FreeCADGui.updateGui()
+        if repaint:
+            FreeCADGui.updateGui()
 
     def saveImage(self):
         """
 Method to save current view as a PNG image.
 
-An image name is pieced together from `record prefix` and `image number`.
-Then an image path is constructed. Animation is disabled(obligatory) and
-current view is saved as an image. Afterwards, if saving the first image(image
-number 0), a chunk with a framerate corresponding to a step size is added.
-Finally the image number is incremented.
+An image path is formatted from `image path template` and `image number`.
+Current view, whose animation was disabled
+(obligatory) when recording started, is saved as an image. Afterwards, if
+saving the first image(image number 0), a chunk with a framerate corresponding
+to a step size is added. Finally the image number is incremented.
         """
         # Prepare complete path to an image
-        name = self.record_prefix + (NAME_NUMBER_FORMAT % self.image_number) \
-            + ".png"
-        image_path = path.join(self.control_proxy.ExportPath, name)
+        image_path = self.image_path_template % self.image_number
 
         # Export image and increase image number
-        FreeCADGui.ActiveDocument.ActiveView.setAnimationEnabled(False)
         FreeCADGui.ActiveDocument.ActiveView.saveImage(
                 image_path,
                 self.control_proxy.VideoWidth, self.control_proxy.VideoHeight)
@@ -641,50 +857,39 @@ Finally the image number is incremented.
                             + "Check Report View for more info.")
         self.image_number += 1
 
-    def findSequences(self, files):
+    def findSequences(self, export_path):
         """
-Method to find sequences between files.
+Method to find sequences between files in an export folder.
 
-Files are scanned for sequences, the valid sequences are recognized and number
-of frames is counted.
+Files in the folder are scanned once and frame numbers of images are collected
+for each sequence. Sequences with frames numbered successively from 0 are
+recognized as valid and their number of frames is counted.
 
 Args:
-    files: A list of string file names.
+    export_path: A str path to a folder with recorded images.
 
 Returns:
     A dict with sequence names and numbers of frames.
         """
-        # Check there are any files
-        if len(files) == 0:
-            return {}
-
-        # Go through the files
-        sequences = {}
-        for f in files:
+        # Go through the files and collect frame numbers of sequences
+        frames = {}
+        with os.scandir(export_path) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
 
-            # Check they fit the name pattern
-            img_name = re.search(r"(seq\d+)-(\d+)(?=\.png)", f)
-            if img_name is not None:
+                # Check they fit the name pattern
+                img_name = SEQUENCE_IMAGE_PATTERN.search(entry.name)
+                if img_name is not None:
+                    frames.setdefault(img_name.group(1), []).append(
+                        int(img_name.group(2)))
 
-                # Add new sequences
-                if img_name.group(1) not in list(sequences.keys()):
-
-                    # Add sequence if it's starting with 0
-                    if int(img_name.group(2)) == 0:
-                        sequences[img_name.group(1)] = 1
-                        last_frame = int(img_name.group(2))
-
-                # Compute number of successive frames
-                elif int(img_name.group(2)) == (last_frame + 1):
-                    sequences[img_name.group(1)] += 1
-                    last_frame += 1
-
-                # Remove sequence if a frame is missing
-                else:
-                    sequences.pop(img_name.group(1))
-
-        # Leave sequences longer than 1 frame
-        sequences = {key: val for key, val in sequences.items() if val > 1}
+        # Leave sequences longer than 1 frame without any frame missing
+        sequences = {}
+        for sequence, numbers in frames.items():
+            numbers.sort()
+            if len(numbers) > 1 and numbers == list(range(len(numbers))):
+                sequences[sequence] = len(numbers)
         return sequences
 
     def showSequences(self, sequences):
@@ -717,7 +922,19 @@ Args:
         self.trv_sequences.setSelectionMode(self.trv_sequences.SingleSelection)
 
         # Prepare a table
-        model = QStandardItemModel(0, 2, self.trv_sequences)
+        model = QStandardItemModel(self.trv_sequences)
+
+        # Add data to the table, a whole column at a time
+        name_items = [QStandardItem(name) for name in sequences.keys()]
+        frames_items = [QStandardItem(str(frames))
+                        for frames in sequences.values()]
+        for itm in name_items + frames_items:
+            itm.setSelectable(True)
+            itm.setEditable(False)
+        for itm in frames_items:
+            itm.setTextAlignment(Qt.AlignmentFlag.AlignRight)
+        model.appendColumn(name_items)
+        model.appendColumn(frames_items)
 
         # Prepare a header
         hdr_name = QStandardItem("Sequence Name")
@@ -726,17 +943,6 @@ Args:
         hdr_frames.setTextAlignment(Qt.AlignmentFlag.AlignRight)
         model.setHorizontalHeaderItem(N_FRAMES, hdr_frames)
 
-        # Add data to the table
-        for name, frames in sequences.items():
-            itm_name = QStandardItem(name)
-            itm_name.setSelectable(True)
-            itm_name.setEditable(False)
-            itm_frames = QStandardItem(str(frames))
-            itm_frames.setSelectable(True)
-            itm_frames.setEditable(False)
-            itm_frames.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-            model.appendRow((itm_name, itm_frames))
-
         # Add the table to the tree view
         self.trv_sequences.setModel(model)
 
@@ -755,42 +961,10 @@ Args:
         # Add buttons for confirmation of a selected sequence and
         # export abortion
         self.btn_confirm = QPushButton("Confirm")
-        self.btn_confirm.setStyleSheet(
-            """
-            QPushButton {
-                background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                            stop: 0 #0B0, stop: 1.0 #0D0);
-                font-weight: bold;
-            }
-            QPushButton:hover {border-color: #0D0;}
-            QPushButton:focus {
-                background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                            stop: 0 #0C0, stop: 1.0 #0F0);
-                border-color: #0E0; color: #FFF;
-            }
-            QPushButton:pressed {
-                background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                            stop: 0 #0F0, stop: 1.0 #0C0);
-            }""")
+        self.btn_confirm.setStyleSheet(CONFIRM_BUTTON_STYLE)
         self.btn_confirm.clicked.connect(self.exportConfirmed)
         self.btn_abort = QPushButton("Abort")
-        self.btn_abort.setStyleSheet(
-            """
-            QPushButton {
-                background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                            stop: 0 #B00, stop: 1.0 #D00);
-                font-weight: bold;
-            }
-            QPushButton:hover {border-color: #D00;}
-            QPushButton:focus {
-                background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                            stop: 0 #C00, stop: 1.0 #F00);
-                border-color: #E00; color: #FFF;
-            }
-            QPushButton:pressed {
-                background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                            stop: 0 #F00, stop: 1.0 #C00);
-            }""")
+        self.btn_abort.setStyleSheet(ABORT_BUTTON_STYLE)
         self.btn_abort.clicked.connect(self.exportAborted)
         self.lyt_export.addWidget(self.btn_confirm)
         self.lyt_export.addWidget(self.btn_abort)
@@ -812,24 +986,30 @@ Args:
         """
 Feedback method called when confirm button was clicked.
 
-Buttons are disabled, framerate is loaded from the first image chunks,
+Confirm button is disabled, framerate is loaded from the first image chunks,
 selected sequence name is used to create an `image name` template and
 a `video name` which can be used in a FFMPEG command. Such a command
-is executed to convert the video, if FFMPEG is installed.
-Otherwise warnings are shown.
+is started directly as a single FFMPEG process to convert the video in
+the background, so that the GUI stays responsive and the conversion can be
+aborted.
         """
-        # Disable export and confirm buttons
+        # Disable confirm button, abort button stops the conversion
         self.btn_confirm.setEnabled(False)
-        self.btn_abort.setEnabled(False)
 
         # Prepare arguments for ffmpeg conversion
         selected_seq = \
             self.trv_sequences.selectionModel().selectedRows()[0].data()
-        # Load framerate
-        image_name = selected_seq + "-" + (NAME_NUMBER_FORMAT % 0) + ".png"
-        image_path = path.join(self.control_proxy.ExportPath, image_name)
+        # Prepare a path template of images in the sequence and a video path
+        # from a path shared by all of them, percent signs in the template
+        # are escaped for both Python and FFMPEG
+        sequence_path = path.normpath(
+                path.join(self.control_proxy.ExportPath, selected_seq))
+        image_template = sequence_path.replace("%", "%%") + "-" \
+            + NAME_NUMBER_FORMAT + ".png"
+        video_name = sequence_path + ".mp4"
+
         # load fps from the first image
-        fps = self.readFramerateChunk(image_path)
+        fps = self.readFramerateChunk(image_template % 0)
         if fps == -1.0:
             fps = 1 / self.control_proxy.StepTime
             QMessageBox.warning(
@@ -839,35 +1019,67 @@ Otherwise warnings are shown.
                             + "Step Time: FPS = 1/(Step Time) = "
                             + str(fps) + ".")
 
-        image_name = '"' + path.normpath(
-                path.join(self.control_proxy.ExportPath, selected_seq + "-"
-                          + NAME_NUMBER_FORMAT + ".png")) + '"'
-        video_name = '"' + path.normpath(
-                path.join(self.control_proxy.ExportPath,
-                          selected_seq + ".mp4")) + '"'
+        # Prepare an ffmpeg process with a list of arguments, so that they
+        # don't need to be parsed by a shell, and no input so that FFMPEG
+        # can't get stuck waiting for an answer
+        self.export_process = QProcess(self)
+        self.export_process.setProgram("ffmpeg")
+        self.export_process.setArguments(
+            ["-r", str(fps), "-i", image_template, "-c:v", "libx264",
+             "-pix_fmt", "yuv420p", video_name])
+        self.export_process.setStandardInputFile(QProcess.nullDevice())
+        self.export_process.finished.connect(self.exportFinished)
+        self.export_process.errorOccurred.connect(self.exportFailed)
+        self.export_process.start()
 
-        # Prepare an ffmpeg command
-        export_command = 'ffmpeg -r ' + str(fps) + ' -i ' + image_name \
-            + ' -c:v libx264 -pix_fmt yuv420p ' + video_name
+    def exportFinished(self, exit_code, exit_status):
+        """
+Feedback method called when the FFMPEG process converting a video finished.
 
-        # Try to run the command
-        try:
-            return_val = subprocess.call(export_command)
-        except OSError as e:
-            if e.errno == os.errno.ENOENT:
-                QMessageBox.warning(None, 'FFMPEG not available',
-                                    "FFMPEG is necessary to export video.\n"
-                                    + "Please install it")
-            else:
-                QMessageBox.warning(None, 'Something failed', str(e))
-        if return_val == 0:
+The result is shown, including the last line FFMPEG printed if it failed.
+Then the export subform is closed.
+
+Args:
+    exit_code: An int exit code of the FFMPEG process.
+    exit_status: A `QProcess.ExitStatus` telling whether the process crashed.
+        """
+        # Ignore processes stopped by aborting the export
+        if self.export_process is None:
+            return
+        stderr = bytes(self.export_process.readAllStandardError()).decode(
+            errors="replace")
+        self.export_process = None
+
+        if exit_status == QProcess.NormalExit and exit_code == 0:
             QMessageBox.information(None, 'Export successful!',
                                     "FFMPEG successfully converted image "
                                     + "sequence into a video.")
         else:
+            FreeCAD.Console.PrintError(stderr + "\n")
             QMessageBox.warning(None, 'FFMPEG unsuccessfull',
                                 "FFMPEG failed to convert sequence into "
-                                + "a video")
+                                + "a video.\n"
+                                + (stderr.strip().splitlines() or [""])[-1])
+
+        # Close the export subform
+        self.closeExportSubform()
+
+    def exportFailed(self, error):
+        """
+Feedback method called when the FFMPEG process reported an error.
+
+Only a failure to start the process is handled here, as the process is not
+finished then. Other errors are reported when the process finishes.
+
+Args:
+    error: A `QProcess.ProcessError` which occurred.
+        """
+        if error != QProcess.FailedToStart or self.export_process is None:
+            return
+        self.export_process = None
+        QMessageBox.warning(None, 'FFMPEG not available',
+                            "FFMPEG is necessary to export video.\n"
+                            + "Please install it")
 
         # Close the export subform
         self.closeExportSubform()
@@ -876,8 +1088,16 @@ Otherwise warnings are shown.
         """
 Feedback method called when abort button was clicked.
 
-The part of the dialog panel used for video exporting is closed.
+A running video conversion is stopped and the part of the dialog panel used
+for video exporting is closed.
         """
+        # Stop the conversion if it's running
+        if self.export_process is not None:
+            process = self.export_process
+            self.export_process = None
+            process.kill()
+            process.waitForFinished()
+
         # Close the export subform
         self.closeExportSubform()
 
@@ -1019,7 +1239,9 @@ To access such a dialog double-click Control in Tree View or right click and
 select *Show control panel* option from a context menu.
 
 Attributes:
-    updated: A bool - True if a property was changed by a class and not user.
+    updated: An int - nonzero while properties are changed by a class not user.
+    change_handlers: A dict of property names and methods reacting to them.
+    time_bounds: A dict of timing property names and their last set bounds.
     temporary_export_path: A str path to an export folder.
 
 
@@ -1030,7 +1252,7 @@ To connect this `Proxy` object to a `DocumentObjectGroupPython` Control do:
         ControlProxy(a)
     """
 
-    updated = False
+    updated = 0
 
     def __init__(self, fp):
         """
@@ -1091,44 +1313,130 @@ Args:
         # Don't do anything if a value was updated because another property
         # had changed
         if self.updated:
-            self.updated = False
             return
 
+        handler = self.change_handlers.get(prop)
+        if handler is not None:
+            handler(self, fp)
+
+    def onStartTimeChanged(self, fp):
+        """
+Method keeping the animation range valid after `StartTime` was changed.
+
+Args:
+    fp : A `DocumentObjectGroupPython` Control object.
+        """
+        # Control animation range so that step size is less than range size
+        if not hasattr(fp, "StopTime") or not hasattr(fp, "StepTime"):
+            return
+        start, step = fp.StartTime, fp.StepTime
+        # Only StopTime can violate its new bound, clamp it here
+        stop = max(fp.StopTime, start + step)
+        with self.suppressUpdates():
+            self.setConstraint(fp, "StopTime", stop, start + step, POS_INF,
+                               0.5)
+            self.setConstraint(fp, "StepTime", step, STEP_MIN, stop - start,
+                               0.1)
+
+    def onStepTimeChanged(self, fp):
+        """
+Method keeping the animation range valid after `StepTime` was changed.
+
+Args:
+    fp : A `DocumentObjectGroupPython` Control object.
+        """
+        # Control animation range so that step size is less than range size
+        if not hasattr(fp, "StartTime") or not hasattr(fp, "StopTime"):
+            return
+        start, step = fp.StartTime, fp.StepTime
+        # Only StopTime can violate its new bound, clamp it here
+        stop = max(fp.StopTime, start + step)
+        with self.suppressUpdates():
+            self.setConstraint(fp, "StopTime", stop, start + step, POS_INF,
+                               0.5)
+            self.setConstraint(fp, "StartTime", start, NEG_INF, stop - step,
+                               0.5)
+
+    def onStopTimeChanged(self, fp):
+        """
+Method keeping the animation range valid after `StopTime` was changed.
+
+Args:
+    fp : A `DocumentObjectGroupPython` Control object.
+        """
         # Control animation range so that step size is less than range size
-        elif prop == "StartTime" and hasattr(fp, "StopTime") and \
-                hasattr(fp, "StepTime"):
-            self.updated = True
-            fp.StopTime = (fp.StopTime, fp.StartTime + fp.StepTime,
-                           float("inf"), 0.5)
-            self.updated = True
-            fp.StepTime = (fp.StepTime, 0.01, fp.StopTime - fp.StartTime, 0.1)
-        elif prop == "StepTime" and hasattr(fp, "StartTime") and \
-                hasattr(fp, "StopTime"):
-            self.updated = True
-            fp.StopTime = (fp.StopTime, fp.StartTime + fp.StepTime,
-                           float("inf"), 0.5)
-            self.updated = True
-            fp.StartTime = (fp.StartTime, -float("inf"),
-                            fp.StopTime - fp.StepTime, 0.5)
-        elif prop == "StopTime" and hasattr(fp, "StartTime") and \
-                hasattr(fp, "StepTime"):
-            self.updated = True
-            fp.StartTime = (fp.StartTime, -float("inf"),
-                            fp.StopTime - fp.StepTime, 0.5)
-            self.updated = True
-            fp.StepTime = (fp.StepTime, 0.01, fp.StopTime - fp.StartTime, 0.1)
-
-        # Return to previous export path if the new one is invalid
-        elif prop == "ExportPath":
-            # Test access right in the folder an show warning if they are not
-            # sufficient
-            if not os.access(fp.ExportPath, os.W_OK | os.R_OK):
-                QMessageBox.warning(None, 'Error while setting Export Path',
-                                    "You don't have access to read and write "
-                                    + "in this folder.")
-                self.updated = True
+        if not hasattr(fp, "StartTime") or not hasattr(fp, "StepTime"):
+            return
+        stop, step = fp.StopTime, fp.StepTime
+        # Only StartTime can violate its new bound, clamp it here
+        start = min(fp.StartTime, stop - step)
+        with self.suppressUpdates():
+            self.setConstraint(fp, "StartTime", start, NEG_INF, stop - step,
+                               0.5)
+            self.setConstraint(fp, "StepTime", step, STEP_MIN, stop - start,
+                               0.1)
+
+    def onExportPathChanged(self, fp):
+        """
+Method returning to a previous export path if the new one is invalid.
+
+Args:
+    fp : A `DocumentObjectGroupPython` Control object.
+        """
+        # An unchanged path was already tested when it was set
+        if fp.ExportPath == getattr(self, "temporary_export_path", None):
+            return
+
+        # Test access right in the folder an show warning if they are not
+        # sufficient
+        if not os.access(fp.ExportPath, os.W_OK | os.R_OK):
+            QMessageBox.warning(None, 'Error while setting Export Path',
+                                "You don't have access to read and write "
+                                + "in this folder.")
+            with self.suppressUpdates():
                 fp.ExportPath = self.temporary_export_path
-                del self.temporary_export_path
+            del self.temporary_export_path
+
+    # Methods reacting to changes of individual properties
+    change_handlers = {"StartTime": onStartTimeChanged,
+                       "StepTime": onStepTimeChanged,
+                       "StopTime": onStopTimeChanged,
+                       "ExportPath": onExportPathChanged}
+
+    def setConstraint(self, fp, prop, value, minimum, maximum, step):
+        """
+Method to set a constrained timing property only if it would change.
+
+A property is rewritten only if its value or its last set bounds differ from
+the new ones, so an unchanged constraint doesn't cost a property update.
+
+Args:
+    fp : A `DocumentObjectGroupPython` Control object.
+    prop: A str name of a `PropertyFloatConstraint` timing property.
+    value: A float value of the property.
+    minimum: A float minimal value of the property.
+    maximum: A float maximal value of the property.
+    step: A float step of the property.
+        """
+        bounds = (minimum, maximum, step)
+        if self.time_bounds.get(prop) != bounds or \
+                getattr(fp, prop) != value:
+            setattr(fp, prop, (value,) + bounds)
+            self.time_bounds[prop] = bounds
+
+    @contextmanager
+    def suppressUpdates(self):
+        """
+Context manager to ignore property changes made by this class.
+
+While inside, `onChanged` doesn't react to changed properties. Nested uses
+are counted, so the changes are ignored until the outermost one is left.
+        """
+        self.updated += 1
+        try:
+            yield
+        finally:
+            self.updated -= 1
 
     def setProperties(self, fp):
         """
@@ -1140,33 +1448,39 @@ The properties are set if they are not already present and an
 Args:
     fp : A restored or barebone `DocumentObjectGroupPython` Control object.
         """
+        # No property is being changed by this class now and bounds of timing
+        # properties are set anew below
+        self.updated = 0
+        self.time_bounds = {}
+
         # Add (and preset) properties
         if not hasattr(fp, "StartTime"):
             fp.addProperty(
                 "App::PropertyFloatConstraint", "StartTime", "Timing",
                 "Animation start time. \nRange is "
-                "< - inf | Stop Time - Step Time >."
-                ).StartTime = (0, -float("inf"), 9.5, 0.5)
+                "< - inf | Stop Time - Step Time >.")
+            self.setConstraint(fp, "StartTime", 0, NEG_INF, 9.5, 0.5)
         elif hasattr(fp, "StepTime") and hasattr(fp, "StopTime"):
-            fp.StartTime = (fp.StartTime, -float("inf"),
-                            fp.StopTime - fp.StepTime, 0.5)
+            self.setConstraint(fp, "StartTime", fp.StartTime, NEG_INF,
+                               fp.StopTime - fp.StepTime, 0.5)
         if not hasattr(fp, "StepTime"):
             fp.addProperty(
                 "App::PropertyFloatConstraint", "StepTime", "Timing",
                 "Animation step time. \nRange is "
-                "< 0.01 | Stop Time - Start Time >."
-                ).StepTime = (0.5, 0.01, 10, 0.1)
+                "< 0.01 | Stop Time - Start Time >.")
+            self.setConstraint(fp, "StepTime", 0.5, STEP_MIN, 10, 0.1)
         elif hasattr(fp, "StartTime") and hasattr(fp, "StopTime"):
-            fp.StepTime = (fp.StepTime, 0.01, fp.StopTime - fp.StartTime, 0.1)
+            self.setConstraint(fp, "StepTime", fp.StepTime, STEP_MIN,
+                               fp.StopTime - fp.StartTime, 0.1)
         if not hasattr(fp, "StopTime"):
             fp.addProperty(
                 "App::PropertyFloatConstraint", "StopTime", "Timing",
                 "Animation stop time. \nRange is "
-                + "< Start Time + Step Time | inf >."
-                ).StopTime = (10, 0.5, float("inf"), 0.5)
+                + "< Start Time + Step Time | inf >.")
+            self.setConstraint(fp, "StopTime", 10, 0.5, POS_INF, 0.5)
         elif hasattr(fp, "StartTime") and hasattr(fp, "StepTime"):
-            fp.StopTime = (fp.StopTime, fp.StartTime + fp.StepTime,
-                           float("inf"), 0.5)
+            self.setConstraint(fp, "StopTime", fp.StopTime,
+                               fp.StartTime + fp.StepTime, POS_INF, 0.5)
 
         if not hasattr(fp, "ExportPath"):
             fp.addProperty(
@@ -1192,6 +1506,33 @@ Args:
         import AnimateDocumentObserver
         AnimateDocumentObserver.addObserver()
 
+    def __getstate__(self):
+        """
+Necessary method to save the proxy's attributes without derived ones.
+
+Bounds of timing properties are not saved by FreeCAD, so their cache is left
+out and started empty when the document is restored.
+
+Returns:
+    A dict of the proxy's attributes except for `time_bounds`.
+        """
+        return {key: value for key, value in self.__dict__.items()
+                if key != "time_bounds"}
+
+    def __setstate__(self, state):
+        """
+Necessary method to restore the proxy's attributes when loading a document.
+
+Bounds cached by older versions are dropped, because restored timing
+properties don't have them set.
+
+Args:
+    state: A dict of the proxy's saved attributes.
+        """
+        if state:
+            self.__dict__.update(state)
+        self.time_bounds = {}
+
 
 class ViewProviderControlProxy:
     """
@@ -1266,15 +1607,7 @@ Args:
     obj: A FreeCAD object hovering above a Control item in the Tree View.
         """
         # Allow only some objects to be dropped into the Control group
-        if hasattr(obj, "Proxy") and \
-           (obj.Proxy.__class__.__name__ == "ServerProxy" or
-           obj.Proxy.__class__.__name__ == "TrajectoryProxy" or
-           obj.Proxy.__class__.__name__ == "CollisionDetectorProxy" or
-           obj.Proxy.__class__.__name__ == "RobWorldProxy" or
-           obj.Proxy.__class__.__name__ == "RobRotationProxy" or
-           obj.Proxy.__class__.__name__ == "RobTranslationProxy"):
-            return True
-        return False
+        return isinstance(getattr(obj, "Proxy", None), DROPPABLE_PROXIES)
 
     def getIcon(self):
         """
@@ -1285,7 +1618,7 @@ A full path to an icon is supplied for the FreeCADGui.
 Returns:
     A str path to an icon.
         """
-        return path.join(PATH_TO_ICONS, "Control.png")
+        return CONTROL_ICON
 
     def setProperties(self, vp):
         """
@@ -1390,6 +1723,8 @@ It controls their behaivor(Active/Inactive) and responds to callbacks after
 either of them was clicked(Activated).
     """
 
+    __slots__ = ()
+
     def GetResources(self):
         """
 Method used by FreeCAD to retrieve resources to use for this command.
@@ -1399,7 +1734,7 @@ Returns:
     a path to a command icon, a text to be shown in a menu and
     a tooltip message.
         """
-        return {'Pixmap': path.join(PATH_TO_ICONS, "ControlCmd.png"),
+        return {'Pixmap': CONTROL_CMD_ICON,
                 'MenuText': "Control",
                 'ToolTip': "Create Control instance."}
 
@@ -1430,10 +1765,7 @@ when there is an active document in which a Control instance can be created.
 Returns:
     True if buttons shall be enabled and False otherwise.
         """
-        if FreeCAD.ActiveDocument is None:
-            return False
-        else:
-            return True
+        return FreeCAD.ActiveDocument is not None
 
 
 if FreeCAD.GuiUp:
@@ -47,6 +47,12 @@ from os import path
 PATH_TO_ICONS = path.join(FreeCAD.getHomePath(), "Mod", "Animate", "Resources",
                           "Icons")
 
+## Path to the RobRotation icon shown in the Tree View.
+ROB_ROTATION_ICON = path.join(PATH_TO_ICONS, "RobRotation.png")
+
+## Path to the RobRotation command icon shown in toolbars and menus.
+ROB_ROTATION_CMD_ICON = path.join(PATH_TO_ICONS, "RobRotationCmd.png")
+
 ## Path to a folder with the necessary user interface files.
 PATH_TO_UI = path.join(FreeCAD.getHomePath(), "Mod", "Animate", "Resources",
                        "UIs")
@@ -829,7 +835,7 @@ A full path to an icon is supplied for the FreeCADGui.
 Returns:
     A str path to an icon.
         """
-        return path.join(PATH_TO_ICONS, "RobRotation.png")
+        return ROB_ROTATION_ICON
 
     def __getstate__(self):
         """
@@ -1099,7 +1105,7 @@ Returns:
     a path to a command icon, a text to be shown in a menu and
     a tooltip message.
         """
-        return {'Pixmap': path.join(PATH_TO_ICONS, "RobRotationCmd.png"),
+        return {'Pixmap': ROB_ROTATION_CMD_ICON,
                 'MenuText': "RobRotation",
                 'ToolTip': "Create RobRotation instance."}
 
@@ -1131,10 +1137,7 @@ can be created.
 Returns:
     True if buttons shall be enabled and False otherwise.
         """
-        if FreeCAD.ActiveDocument is None:
-            return False
-        else:
-            return True
+        return FreeCAD.ActiveDocument is not None
 
 
 if FreeCAD.GuiUp:
@@ -47,6 +47,12 @@ from os import path
 PATH_TO_ICONS = path.join(FreeCAD.getHomePath(), "Mod", "Animate", "Resources",
                           "Icons")
 
+## Path to the RobTranslation icon shown in the Tree View.
+ROB_TRANSLATION_ICON = path.join(PATH_TO_ICONS, "RobTranslation.png")
+
+## Path to the RobTranslation command icon shown in toolbars and menus.
+ROB_TRANSLATION_CMD_ICON = path.join(PATH_TO_ICONS, "RobTranslationCmd.png")
+
 ## Path to a folder with the necessary user interface files.
 PATH_TO_UI = path.join(FreeCAD.getHomePath(), "Mod", "Animate", "Resources",
                        "UIs")
@@ -819,7 +825,7 @@ A full path to an icon is supplied for the FreeCADGui.
 Returns:
     A str path to an icon.
         """
-        return path.join(PATH_TO_ICONS, "RobTranslation.png")
+        return ROB_TRANSLATION_ICON
 
     def __getstate__(self):
         """
@@ -1089,7 +1095,7 @@ Returns:
     a path to a command icon, a text to be shown in a menu and
     a tooltip message.
         """
-        return {'Pixmap': path.join(PATH_TO_ICONS, "RobTranslationCmd.png"),
+        return {'Pixmap': ROB_TRANSLATION_CMD_ICON,
                 'MenuText': "RobTranslation",
                 'ToolTip': "Create RobTranslation instance."}
 
@@ -1121,10 +1127,7 @@ instance can be created.
 Returns:
     True if buttons shall be enabled and False otherwise.
         """
-        if FreeCAD.ActiveDocument is None:
-            return False
-        else:
-            return True
+        return FreeCAD.ActiveDocument is not None
 
 
 if FreeCAD.GuiUp:
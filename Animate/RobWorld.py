@@ -43,6 +43,12 @@ from os import path
 PATH_TO_ICONS = path.join(FreeCAD.getHomePath(), "Mod", "Animate", "Resources",
                           "Icons")
 
+## Path to the RobWorld icon shown in the Tree View.
+ROB_WORLD_ICON = path.join(PATH_TO_ICONS, "RobWorld.png")
+
+## Path to the RobWorld command icon shown in toolbars and menus.
+ROB_WORLD_CMD_ICON = path.join(PATH_TO_ICONS, "RobWorldCmd.png")
+
 
 class RobWorldProxy:
     """
@@ -522,7 +528,7 @@ A full path to an icon is supplied for the FreeCADGui.
 Returns:
     A str path to an icon.
         """
-        return path.join(PATH_TO_ICONS, "RobWorld.png")
+        return ROB_WORLD_ICON
 
     def __getstate__(self):
         """
@@ -720,7 +726,7 @@ Returns:
     a path to a command icon, a text to be shown in a menu and
     a tooltip message.
         """
-        return {'Pixmap': path.join(PATH_TO_ICONS, "RobWorldCmd.png"),
+        return {'Pixmap': ROB_WORLD_CMD_ICON,
                 'MenuText': "RobWorld",
                 'ToolTip': "Create RobWorld instance."}
 
@@ -752,10 +758,7 @@ only when there is an active document in which a RobWorld instance can
 Returns:
     True if buttons shall be enabled and False otherwise.
         """
-        if FreeCAD.ActiveDocument is None:
-            return False
-        else:
-            return True
+        return FreeCAD.ActiveDocument is not None
 
 
 if FreeCAD.GuiUp:
@@ -44,6 +44,15 @@ from os import path
 PATH_TO_ICONS = path.join(FreeCAD.getHomePath(), "Mod", "Animate", "Resources",
                           "Icons")
 
+## Path to the Server icon shown in the Tree View.
+SERVER_ICON = path.join(PATH_TO_ICONS, "Server.png")
+
+## Path to the Server icon shown in the Tree View while running.
+SERVER_RUNNING_ICON = path.join(PATH_TO_ICONS, "ServerRunning.png")
+
+## Path to the Server command icon shown in toolbars and menus.
+SERVER_CMD_ICON = path.join(PATH_TO_ICONS, "ServerCmd.png")
+
 
 class ServerProxy(object):
     """
@@ -158,14 +167,12 @@ Args:
         if fp.Running:
             self.cmd_server = com.startServer(fp.Address, fp.Port)
             if self.cmd_server == com.SERVER_ERROR_INVALID_ADDRESS:
-                fp.ViewObject.Proxy._icon = path.join(PATH_TO_ICONS,
-                                                      "Server.png")
+                fp.ViewObject.Proxy._icon = SERVER_ICON
                 QMessageBox.warning(None, 'Error while starting server',
                                     "The address was not in supported format.")
                 fp.Running = False
             elif self.cmd_server == com.SERVER_ERROR_PORT_OCCUPIED:
-                fp.ViewObject.Proxy._icon = path.join(PATH_TO_ICONS,
-                                                      "Server.png")
+                fp.ViewObject.Proxy._icon = SERVER_ICON
                 QMessageBox.warning(None, 'Error while starting server',
                                     "The port requested is already occupied.")
                 fp.Running = False
@@ -173,8 +180,7 @@ Args:
                 fp.setEditorMode("Address", 1)
                 fp.setEditorMode("Port", 1)
                 fp.Running = True
-                fp.ViewObject.Proxy._icon = path.join(PATH_TO_ICONS,
-                                                      "ServerRunning.png")
+                fp.ViewObject.Proxy._icon = SERVER_RUNNING_ICON
 
         # Make an document observer to be notified when document will be closed
         import AnimateDocumentObserver
@@ -232,7 +238,7 @@ Server.ViewObject do:
         ViewProviderServerProxy(a.ViewObject)
     """
 
-    _icon = path.join(PATH_TO_ICONS, "Server.png")
+    _icon = SERVER_ICON
 
     def __init__(self, vp):
         """
@@ -302,13 +308,13 @@ Returns:
                 vp.Object.setEditorMode("Address", 1)
                 vp.Object.setEditorMode("Port", 1)
                 vp.Object.Running = True
-                self._icon = path.join(PATH_TO_ICONS, "ServerRunning.png")
+                self._icon = SERVER_RUNNING_ICON
         elif vp.Object.Running:
             vp.Object.Proxy.cmd_server.close()
             vp.Object.setEditorMode("Address", 0)
             vp.Object.setEditorMode("Port", 0)
             vp.Object.Running = False
-            self._icon = path.join(PATH_TO_ICONS, "Server.png")
+            self._icon = SERVER_ICON
         return True
 
     def setupContextMenu(self, vp, menu):
@@ -370,9 +376,9 @@ Args:
         vp.setEditorMode("Visibility", 2)
 
         if vp.Object.Running:
-            self._icon = path.join(PATH_TO_ICONS, "ServerRunning.png")
+            self._icon = SERVER_RUNNING_ICON
         else:
-            self._icon = path.join(PATH_TO_ICONS, "Server.png")
+            self._icon = SERVER_ICON
 
 
 class ServerCommand(object):
@@ -393,7 +399,7 @@ Returns:
     a path to a command icon, a text to be shown in a menu and
     a tooltip message.
     """
-        return {'Pixmap': path.join(PATH_TO_ICONS, "ServerCmd.png"),
+        return {'Pixmap': SERVER_CMD_ICON,
                 'MenuText': "Server",
                 'ToolTip': "Create Server instance."}
 
@@ -424,10 +430,7 @@ can be created.
 Returns:
     True if buttons shall be enabled and False otherwise.
         """
-        if FreeCAD.ActiveDocument is None:
-            return False
-        else:
-            return True
+        return FreeCAD.ActiveDocument is not None
 
 
 if FreeCAD.GuiUp:
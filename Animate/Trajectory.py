@@ -35,6 +35,7 @@ used in a workbench.
 
 import FreeCAD
 import FreeCADGui
+import numpy
 
 from PySide2.QtWidgets import QDialogButtonBox
 from PySide2.QtWidgets import QMessageBox
@@ -47,6 +48,12 @@ from os import path
 PATH_TO_ICONS = path.join(FreeCAD.getHomePath(), "Mod", "Animate", "Resources",
                         "Icons")
 
+## Path to the Trajectory icon shown in the Tree View.
+TRAJECTORY_ICON = path.join(PATH_TO_ICONS, "Trajectory.png")
+
+## Path to the Trajectory command icon shown in toolbars and menus.
+TRAJECTORY_CMD_ICON = path.join(PATH_TO_ICONS, "TrajectoryCmd.png")
+
 ## Path to a folder with the necessary user interface files.
 PATH_TO_UI = path.join(FreeCAD.getHomePath(), "Mod", "Animate", "Resources",
                      "UIs")
@@ -229,6 +236,7 @@ a `TrajectoryPanel` to be able to see an object progress through a trajectory.
 
 Attributes:
     pose: A dict describing a pose - position, rotation axis, point and angle.
+    baked_poses: A dict of animation times and poses precomputed for them.
 
 To connect this `Proxy` object to a `DocumentObjectGroupPython` Trajectory do:
 
@@ -275,6 +283,11 @@ Args:
 #            traj_valid = self.is_ValidTrajectory(trajectory=traj)
             if traj_valid != fp.ValidTrajectory:
                 fp.ValidTrajectory = traj_valid
+            # Precomputed poses no longer correspond to the trajectory
+            self.baked_poses = {}
+
+        elif prop == "Interpolate":
+            self.baked_poses = {}
 
         elif prop == "Placement":
             # Propagate the Placement updates down the chain
@@ -311,29 +324,23 @@ Args:
                                          "is not in a valid format.\n")
             return
 
-        # Update placement according to current time and trajectory
-        indices, weights = self.find_timestamp_indices_and_weights(fp)
-
-        self.pose["position"] = (weights[0]*fp.TranslationX[indices[0]] +
-                                 weights[1]*fp.TranslationX[indices[1]],
-                                 weights[0]*fp.TranslationY[indices[0]] +
-                                 weights[1]*fp.TranslationY[indices[1]],
-                                 weights[0]*fp.TranslationZ[indices[0]] +
-                                 weights[1]*fp.TranslationZ[indices[1]])
-        self.pose["rot_axis"] = (weights[0]*fp.RotationAxisX[indices[0]]
-                                 + weights[1]*fp.RotationAxisX[indices[1]],
-                                 weights[0]*fp.RotationAxisY[indices[0]]
-                                 + weights[1]*fp.RotationAxisY[indices[1]],
-                                 weights[0]*fp.RotationAxisZ[indices[0]]
-                                 + weights[1]*fp.RotationAxisZ[indices[1]])
-        self.pose["rot_point"] = (weights[0]*fp.RotationPointX[indices[0]]
-                                  + weights[1]*fp.RotationPointX[indices[1]],
-                                  weights[0]*fp.RotationPointY[indices[0]]
-                                  + weights[1]*fp.RotationPointY[indices[1]],
-                                  weights[0]*fp.RotationPointZ[indices[0]]
-                                  + weights[1]*fp.RotationPointZ[indices[1]])
-        self.pose["rot_angle"] = (weights[0]*fp.RotationAngle[indices[0]]
-                                  + weights[1]*fp.RotationAngle[indices[1]])
+        # Use a pose precomputed for current time if there is one, otherwise
+        # update placement according to current time and trajectory
+        pose = self.baked_poses.get(fp.Time)
+        if pose is None:
+            indices, weights = self.find_timestamp_indices_and_weights(fp)
+            pose = tuple(weights[0]*values[indices[0]]
+                         + weights[1]*values[indices[1]]
+                         for values in (fp.TranslationX, fp.TranslationY,
+                                        fp.TranslationZ, fp.RotationAxisX,
+                                        fp.RotationAxisY, fp.RotationAxisZ,
+                                        fp.RotationPointX, fp.RotationPointY,
+                                        fp.RotationPointZ, fp.RotationAngle))
+
+        self.pose["position"] = pose[0:3]
+        self.pose["rot_axis"] = pose[3:6]
+        self.pose["rot_point"] = pose[6:9]
+        self.pose["rot_angle"] = pose[9]
 
         fp.ObjectPlacement = FreeCAD.Placement(
             FreeCAD.Vector(self.pose["position"][0],
@@ -378,6 +385,7 @@ Args:
                      "rot_axis":  (0, 0, 0),
                      "rot_point": (0, 0, 0),
                      "rot_angle": None}
+        self.baked_poses = {}
 
         # Add (and preset) properties
         # Animation properties
@@ -795,6 +803,87 @@ Returns:
 
         return indices, weights
 
+    def bake_poses(self, fp, times):
+        """
+Method to precompute poses for a whole sequence of animation `times` at once.
+
+Timestamp indices and weights are found for all `times` together the same way
+`find_timestamp_indices_and_weights` finds them for a single time. Poses are
+then interpolated as one NumPy array and stored in the `baked_poses` dictionary
+so that `execute` only looks them up instead of interpolating each frame.
+
+Args:
+    fp: A `DocumentObjectGroupPython` Trajectory object.
+    times: A list of floats with animation times to be shown.
+        """
+        self.baked_poses = {}
+        if not fp.ValidTrajectory or len(times) == 0:
+            return
+
+        timestamps = numpy.array(fp.Timestamps)
+        t = numpy.array(times)
+
+        # Find the indices of the closest higher and lower timestamps
+        upper = numpy.clip(numpy.searchsorted(timestamps, t, side="right"),
+                           1, len(timestamps) - 1)
+        lower = upper - 1
+        weights_lower = timestamps[upper] - t
+        weights_upper = t - timestamps[lower]
+        if not fp.Interpolate:
+            weights_lower = (weights_lower > weights_upper).astype(float)
+            weights_upper = 1 - weights_lower
+        else:
+            # Only a trajectory with a single timestamp has zero spans
+            span = timestamps[upper] - timestamps[lower]
+            span[span == 0] = 1
+            weights_lower = weights_lower / span
+            weights_upper = weights_upper / span
+
+        # Use the first/last timestamp for times outside of the Timestamps
+        before = t <= timestamps[0]
+        after = t >= timestamps[-1]
+        lower[before], upper[before] = 0, 0
+        lower[after], upper[after] = -1, -1
+        weights_lower[before | after] = 1
+        weights_upper[before | after] = 0
+
+        # Interpolate all pose elements for all times at once
+        values = numpy.array([fp.TranslationX, fp.TranslationY,
+                              fp.TranslationZ, fp.RotationAxisX,
+                              fp.RotationAxisY, fp.RotationAxisZ,
+                              fp.RotationPointX, fp.RotationPointY,
+                              fp.RotationPointZ, fp.RotationAngle])
+        poses = weights_lower*values[:, lower] + weights_upper*values[:, upper]
+
+        self.baked_poses = dict(zip(times, map(tuple, poses.T.tolist())))
+
+    def __getstate__(self):
+        """
+Necessary method to save the proxy's attributes without precomputed poses.
+
+Poses baked for playback are derived from the trajectory and can be large,
+so they are left out and started empty when the document is restored.
+
+Returns:
+    A dict of the proxy's attributes except for `baked_poses`.
+        """
+        return {key: value for key, value in self.__dict__.items()
+                if key != "baked_poses"}
+
+    def __setstate__(self, state):
+        """
+Necessary method to restore the proxy's attributes when loading a document.
+
+Documents saved by older versions have no state, so `setProperties` has to
+recreate the `pose` in that case when the document is restored.
+
+Args:
+    state: A dict of the proxy's saved attributes or None.
+        """
+        if state:
+            self.__dict__.update(state)
+        self.baked_poses = {}
+
 
 class ViewProviderTrajectoryProxy:
     """
@@ -1170,7 +1259,7 @@ A full path to an icon is supplied for the FreeCADGui.
 Returns:
     A str path to an icon.
         """
-        return path.join(PATH_TO_ICONS, "Trajectory.png")
+        return TRAJECTORY_ICON
 
     def __getstate__(self):
         """
@@ -1255,8 +1344,8 @@ Args:
                 # a reference to a Trajectory panel
                 trajectories = []
                 for obj in FreeCAD.ActiveDocument.Objects:
-                    if hasattr(obj, "Proxy") and \
-                            obj.Proxy.__class__.__name__ == "TrajectoryProxy":
+                    if isinstance(getattr(obj, "Proxy", None),
+                                  TrajectoryProxy):
                         if obj.ViewObject.Proxy.panel is not None:
                             trajectories.append(obj)
 
@@ -1498,7 +1587,7 @@ Returns:
     a path to a command icon, a text to be shown in a menu and
     a tooltip message.
         """
-        return {'Pixmap': path.join(PATH_TO_ICONS, "TrajectoryCmd.png"),
+        return {'Pixmap': TRAJECTORY_CMD_ICON,
                 'MenuText': "Trajectory",
                 'ToolTip': "Create Trajectory instance."}
 
@@ -1530,10 +1619,7 @@ only when there is an active document in which a Trajectory instance can
 Returns:
     True if buttons shall be enabled and False otherwise.
         """
-        if FreeCAD.ActiveDocument is None:
-            return False
-        else:
-            return True
+        return FreeCAD.ActiveDocument is not None
 
 
 if FreeCAD.GuiUp: